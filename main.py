@@ -8,12 +8,6 @@ import sys
 import os
 from pathlib import Path
 
-# Add src directory to Python path
-sys.path.append(str(Path(__file__).parent / "src"))
-
-from optimization.route_optimizer import RouteOptimizer
-from visualization.dashboard import Dashboard
-from utils.config import DATA_GENERATION, OPTIMIZATION
 import logging
 
 # Setup logging
@@ -24,8 +18,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+_DIRECTORIES_ENSURED = False
+
+
 def setup_directories():
     """Create necessary directories if they don't exist"""
+    global _DIRECTORIES_ENSURED
+    if _DIRECTORIES_ENSURED:
+        return
+
     directories = [
         "data/generated",
         "data/output",
@@ -33,14 +34,22 @@ def setup_directories():
     ]
 
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        logger.info(f"Ensured directory exists: {directory}")
+        path = Path(directory)
+        # A single stat for existing directories instead of mkdir's per-component checks
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Created directory: {directory}")
+
+    _DIRECTORIES_ENSURED = True
 
 
 def run_optimization_cli(args):
     """Run optimization from command line interface"""
     logger.info("Starting LPG Delivery Route Optimization (CLI mode)")
 
+    # Imported here so other subcommands (and --help) skip loading the solver stack
+    from src.optimization.route_optimizer import RouteOptimizer
+
     try:
         # Initialize optimizer
         optimizer = RouteOptimizer(seed=args.seed)
@@ -138,7 +147,7 @@ def print_optimization_summary(results, verbose=False):
 
 def save_results(results, output_file=None):
     """Save optimization results to file"""
-    import json
+    from src.utils.serialization import write_json
 
     if output_file is None:
         from datetime import datetime
@@ -146,8 +155,7 @@ def save_results(results, output_file=None):
         output_file = f"optimization_results_{timestamp}.json"
 
     try:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        write_json(output_file, results, default=str)
         logger.info(f"Results saved to: {output_file}")
     except Exception as e:
         logger.error(f"Failed to save results: {str(e)}")
@@ -159,6 +167,7 @@ def launch_dashboard(args):
 
     try:
         # Import and run dashboard
+        from src.visualization.dashboard import Dashboard
         dashboard = Dashboard()
 
         # Store launch args in session state if needed
@@ -181,6 +190,8 @@ def run_demo():
     """Run a complete demonstration of the system"""
     logger.info("🎬 Running LPG Delivery Route Optimization Demo")
 
+    from src.optimization.route_optimizer import RouteOptimizer
+
     try:
         # Initialize optimizer with demo seed
         optimizer = RouteOptimizer(seed=42)
@@ -2,7 +2,7 @@
 Data generation and processing modules for LPG delivery optimization
 """
 
-from .mock_data_generator import MockDataGenerator, DeliveryPoint
+from .mock_data_generator import MockDataGenerator
 from .distance_matrix import DistanceMatrix
 
-__all__ = ['MockDataGenerator', 'DeliveryPoint', 'DistanceMatrix']
\ No newline at end of file
+__all__ = ['MockDataGenerator', 'DistanceMatrix']
\ No newline at end of file
@@ -7,168 +7,179 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 from faker import Faker
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
 import math
+from functools import lru_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on environment
+    pa = None
 
 from ..utils.config import (
     GEOGRAPHIC, DELIVERY, DATA_GENERATION,
     get_generated_data_path
 )
+from ..utils.geo import haversine_km_array
 
+_KM_PER_DEG_LAT = 111.32  # ~111.32 km per degree latitude
 
-class DeliveryPoint:
-    """Represents a single delivery point"""
-
-    def __init__(self,
-                 id: int,
-                 latitude: float,
-                 longitude: float,
-                 demand: int,
-                 time_window_start: datetime,
-                 time_window_end: datetime,
-                 service_time_minutes: int,
-                 priority: str,
-                 address: str,
-                 area_type: str):
-        self.id = id
-        self.latitude = latitude
-        self.longitude = longitude
-        self.demand = demand
-        self.time_window_start = time_window_start
-        self.time_window_end = time_window_end
-        self.service_time_minutes = service_time_minutes
-        self.priority = priority
-        self.address = address
-        self.area_type = area_type
-
-    def to_dict(self) -> Dict:
-        """Convert to dictionary representation"""
-        return {
-            'id': self.id,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'demand': self.demand,
-            'time_window_start': self.time_window_start.strftime('%H:%M'),
-            'time_window_end': self.time_window_end.strftime('%H:%M'),
-            'service_time_minutes': self.service_time_minutes,
-            'priority': self.priority,
-            'address': self.address,
-            'area_type': self.area_type
-        }
+# Urban cluster process shape: mean points per cluster, spread of parent
+# centers and of points around them, as fractions of the urban radius
+_URBAN_POINTS_PER_CLUSTER = 6
+_URBAN_PARENT_RADIUS_FRACTION = 0.6
+_URBAN_CLUSTER_SIGMA_FRACTION = 0.12
+
+
+def _format_hhmm(hours: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    """Format parallel hour/minute arrays as "HH:MM" strings"""
+    return np.char.add(np.char.mod('%02d:', hours), np.char.mod('%02d', minutes))
+
+
+def _join_str(*parts) -> np.ndarray:
+    """Element-wise concatenation of string arrays and scalar separators"""
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.char.add(result, part)
+    return result
+
+
+URBAN_STREET_TYPES = ['St', 'Ave', 'Dr', 'Rd', 'Blvd', 'Ln']
+RURAL_ROAD_TYPES = ['County Road', 'Farm to Market Road', 'Rural Route']
+COUNTY_NAMES = ['Dallas', 'Tarrant', 'Collin', 'Denton', 'Johnson']
+
+STREET_NAME_POOL_SIZE = 256
+
+
+@lru_cache(maxsize=1)
+def _street_name_pool() -> Tuple[str, ...]:
+    """Fixed corpus of Faker street names, sampled once per process"""
+    faker = Faker()
+    faker.seed_instance(0)
+    return tuple(faker.street_name() for _ in range(STREET_NAME_POOL_SIZE))
 
 
 class MockDataGenerator:
     """Generates realistic mock delivery data for mixed urban/rural areas"""
 
     def __init__(self, seed: Optional[int] = None):
-        self.faker = Faker()
-        if seed:
-            Faker.seed(seed)
-            random.seed(seed)
-            np.random.seed(seed)
+        # Single PCG64 stream for every draw so one seed reproduces the whole scenario
+        self.rng = np.random.default_rng(seed)
+        # Loop-invariant geometry for point sampling; the urban center is fixed within a run
+        self._urban_lon_scale = _KM_PER_DEG_LAT * math.cos(math.radians(GEOGRAPHIC.urban_center[0]))
+        self._rural_min_distance_km = 1.5 * GEOGRAPHIC.urban_radius_km
+        # Addresses draw street names from a cached corpus instead of calling Faker per row
+        self._street_pool = _street_name_pool()
 
     def _generate_urban_points(self, num_points: int) -> List[Tuple[float, float]]:
         """Generate tightly clustered urban delivery points"""
         center_lat, center_lon = GEOGRAPHIC.urban_center
         radius_km = GEOGRAPHIC.urban_radius_km
 
-        points = []
-        for _ in range(num_points):
-            # Generate points using normal distribution around center
-            angle = random.uniform(0, 2 * math.pi)
-            # Use normal distribution for more realistic clustering
-            distance = np.random.normal(0, radius_km/3)
-            distance = min(abs(distance), radius_km)  # Limit to radius
-
-            # Convert distance to lat/lon offset
-            lat_offset = distance * math.cos(angle) / 111.32  # ~111.32 km per degree latitude
-            lon_offset = distance * math.sin(angle) / (111.32 * math.cos(math.radians(center_lat)))
+        # Thomas cluster process conditioned on num_points: parent centers
+        # uniform in the inner urban disk, each point joins a random parent with
+        # a Gaussian offset, all in one batched draw per quantity
+        num_parents = max(1, round(num_points / _URBAN_POINTS_PER_CLUSTER))
+        parent_r = radius_km * _URBAN_PARENT_RADIUS_FRACTION * np.sqrt(self.rng.random(num_parents))
+        parent_theta = self.rng.uniform(0, 2 * math.pi, num_parents)
+        parents = np.column_stack([parent_r * np.cos(parent_theta), parent_r * np.sin(parent_theta)])
 
-            lat = center_lat + lat_offset
-            lon = center_lon + lon_offset
+        membership = self.rng.integers(num_parents, size=num_points)
+        offsets = self.rng.normal(0, radius_km * _URBAN_CLUSTER_SIGMA_FRACTION, (num_points, 2))
+        positions_km = parents[membership] + offsets
 
-            points.append((lat, lon))
+        # Pull stray points back onto the urban boundary
+        distances = np.hypot(positions_km[:, 0], positions_km[:, 1])
+        positions_km *= (np.minimum(distances, radius_km) / np.maximum(distances, 1e-12))[:, None]
 
-        return points
+        # Convert km offsets (north, east) to lat/lon
+        lats = center_lat + positions_km[:, 0] / _KM_PER_DEG_LAT
+        lons = center_lon + positions_km[:, 1] / self._urban_lon_scale
+        return list(zip(lats.tolist(), lons.tolist()))
 
     def _generate_rural_points(self, num_points: int) -> List[Tuple[float, float]]:
         """Generate widely spread rural delivery points"""
-        points = []
-
-        for _ in range(num_points):
-            # Uniform distribution across the wider rural area
-            lat = random.uniform(GEOGRAPHIC.lat_min, GEOGRAPHIC.lat_max)
-            lon = random.uniform(GEOGRAPHIC.lon_min, GEOGRAPHIC.lon_max)
-
-            # Avoid urban center area
-            center_lat, center_lon = GEOGRAPHIC.urban_center
-            distance_from_center = self._calculate_distance(center_lat, center_lon, lat, lon)
-
-            # If too close to urban center, regenerate
-            if distance_from_center < GEOGRAPHIC.urban_radius_km * 1.5:
-                lat = random.uniform(GEOGRAPHIC.lat_min, GEOGRAPHIC.lat_max)
-                lon = random.uniform(GEOGRAPHIC.lon_min, GEOGRAPHIC.lon_max)
-
-            points.append((lat, lon))
-
-        return points
-
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance between two points in kilometers"""
-        from haversine import haversine
-        return haversine((lat1, lon1), (lat2, lon2))
-
-    def _generate_demand(self) -> int:
-        """Generate realistic LPG cylinder demand"""
+        center_lat, center_lon = GEOGRAPHIC.urban_center
+        min_distance_km = self._rural_min_distance_km
+        if num_points <= 0:
+            return []
+
+        # Jittered stratified grid over the bounding box: one point per cell
+        # spreads rural stops evenly; cells inside the urban exclusion disk are
+        # dropped and the survivors subsampled, normally in a single pass
+        num_cells = num_points * 2
+        while True:
+            cells_per_side = math.ceil(math.sqrt(num_cells))
+            rows, cols = np.divmod(np.arange(cells_per_side ** 2), cells_per_side)
+            jitter = self.rng.random((2, cells_per_side ** 2))
+            lat_step = (GEOGRAPHIC.lat_max - GEOGRAPHIC.lat_min) / cells_per_side
+            lon_step = (GEOGRAPHIC.lon_max - GEOGRAPHIC.lon_min) / cells_per_side
+            cand_lats = GEOGRAPHIC.lat_min + (rows + jitter[0]) * lat_step
+            cand_lons = GEOGRAPHIC.lon_min + (cols + jitter[1]) * lon_step
+
+            distances = haversine_km_array(np.radians(center_lat), np.radians(center_lon),
+                                           np.radians(cand_lats), np.radians(cand_lons))
+            keep = np.flatnonzero(distances >= min_distance_km)
+            if len(keep) >= num_points:
+                break
+            num_cells *= 2
+
+        chosen = self.rng.choice(keep, num_points, replace=False)
+        return list(zip(cand_lats[chosen].tolist(), cand_lons[chosen].tolist()))
+
+    def _generate_demands(self, num_points: int) -> np.ndarray:
+        """Generate realistic LPG cylinder demand for every delivery"""
         # Most deliveries are small, some are larger
         weights = [0.6, 0.25, 0.1, 0.05]  # 60% small, 5% large
-        demand_ranges = [(1, 5), (6, 10), (11, 15), (16, 20)]
+        range_lows = np.array([1, 6, 11, 16])
+        range_highs = np.array([5, 10, 15, 20])
 
-        chosen_range = random.choices(demand_ranges, weights=weights)[0]
-        return random.randint(chosen_range[0], chosen_range[1])
+        chosen_ranges = self.rng.choice(len(weights), size=num_points, p=weights)
+        return self.rng.integers(range_lows[chosen_ranges], range_highs[chosen_ranges] + 1)
 
-    def _generate_time_window(self, base_date: datetime) -> Tuple[datetime, datetime]:
-        """Generate delivery time window"""
-        start_hour = random.randint(
+    def _generate_time_windows(self, num_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate "HH:MM" start and end strings for every delivery time window"""
+        start_hours = self.rng.integers(
             DATA_GENERATION.time_window_start_hour,
-            DATA_GENERATION.time_window_end_hour - DATA_GENERATION.time_window_duration_hours
+            DATA_GENERATION.time_window_end_hour - DATA_GENERATION.time_window_duration_hours + 1,
+            num_points
         )
+        start_minutes = self.rng.choice([0, 30], num_points)
+        end_hours = (start_hours + DATA_GENERATION.time_window_duration_hours) % 24
 
-        start_time = base_date.replace(hour=start_hour, minute=random.choice([0, 30]))
-        end_time = start_time + timedelta(hours=DATA_GENERATION.time_window_duration_hours)
-
-        return start_time, end_time
+        return _format_hhmm(start_hours, start_minutes), _format_hhmm(end_hours, start_minutes)
 
-    def _calculate_service_time(self, demand: int) -> int:
-        """Calculate service time based on demand"""
+    def _calculate_service_times(self, demands: np.ndarray) -> np.ndarray:
+        """Calculate service time for each delivery based on demand"""
         base_time = DELIVERY.base_service_time_minutes
-        additional_time = demand * DELIVERY.service_time_per_cylinder_minutes
-        return int(base_time + additional_time)
+        additional_time = demands * DELIVERY.service_time_per_cylinder_minutes
+        return (base_time + additional_time).astype(int)
 
-    def _determine_priority(self) -> str:
-        """Determine delivery priority"""
+    def _determine_priorities(self, num_points: int) -> np.ndarray:
+        """Determine priority for every delivery"""
         priorities = list(DELIVERY.priority_distribution.keys())
-        weights = list(DELIVERY.priority_distribution.values())
-        return random.choices(priorities, weights=weights)[0]
-
-    def _generate_address(self, latitude: float, longitude: float, area_type: str) -> str:
-        """Generate realistic address based on area type"""
-        if area_type == 'urban':
-            # Urban addresses are more specific
-            street_types = ['St', 'Ave', 'Dr', 'Rd', 'Blvd', 'Ln']
-            street_name = self.faker.street_name()
-            street_type = random.choice(street_types)
-            number = random.randint(100, 9999)
-            return f"{number} {street_name} {street_type}"
-        else:
-            # Rural addresses use county roads and routes
-            county_names = ['Dallas', 'Tarrant', 'Collin', 'Denton', 'Johnson']
-            road_types = ['County Road', 'Farm to Market Road', 'Rural Route']
-            road_type = random.choice(road_types)
-            number = random.randint(1, 999)
-            county = random.choice(county_names)
-            return f"{number} {road_type} {number}, {county} County"
+        weights = np.array(list(DELIVERY.priority_distribution.values()))
+        return self.rng.choice(priorities, size=num_points, p=weights / weights.sum())
+
+    def _generate_addresses(self, num_urban: int, num_rural: int) -> np.ndarray:
+        """Generate realistic addresses for urban then rural deliveries in one batch"""
+        # Urban addresses are more specific
+        urban = _join_str(
+            self.rng.integers(100, 10000, num_urban).astype(str), ' ',
+            self.rng.choice(self._street_pool, num_urban), ' ',
+            self.rng.choice(URBAN_STREET_TYPES, num_urban)
+        )
+
+        # Rural addresses use county roads and routes
+        numbers = self.rng.integers(1, 1000, num_rural).astype(str)
+        rural = _join_str(
+            numbers, ' ', self.rng.choice(RURAL_ROAD_TYPES, num_rural), ' ', numbers, ', ',
+            self.rng.choice(COUNTY_NAMES, num_rural), ' County'
+        )
+
+        return np.concatenate([urban, rural])
 
     def generate_delivery_data(self, num_deliveries: int = None) -> pd.DataFrame:
         """Generate complete delivery dataset"""
@@ -183,73 +194,64 @@ class MockDataGenerator:
         urban_points = self._generate_urban_points(num_urban)
         rural_points = self._generate_rural_points(num_rural)
 
-        # Combine points and create delivery points
+        # Build each column in one pass rather than one object per row
         all_points = urban_points + rural_points
         area_types = ['urban'] * num_urban + ['rural'] * num_rural
-
-        delivery_points = []
-        base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        for i, ((lat, lon), area_type) in enumerate(zip(all_points, area_types)):
-            # Generate delivery characteristics
-            demand = self._generate_demand()
-            time_start, time_end = self._generate_time_window(base_date)
-            service_time = self._calculate_service_time(demand)
-            priority = self._determine_priority()
-            address = self._generate_address(lat, lon, area_type)
-
-            delivery = DeliveryPoint(
-                id=i + 1,  # Start from 1, 0 is reserved for depot
-                latitude=lat,
-                longitude=lon,
-                demand=demand,
-                time_window_start=time_start,
-                time_window_end=time_end,
-                service_time_minutes=service_time,
-                priority=priority,
-                address=address,
-                area_type=area_type
-            )
-
-            delivery_points.append(delivery)
-
-        # Convert to DataFrame
-        delivery_data = [point.to_dict() for point in delivery_points]
-        df = pd.DataFrame(delivery_data)
-
-        # Add depot as first location (center of operations)
-        depot_data = {
-            'id': 0,
-            'latitude': GEOGRAPHIC.center_lat,
-            'longitude': GEOGRAPHIC.center_lon,
-            'demand': 0,
-            'time_window_start': f"{DELIVERY.working_hours_start:02d}:00",
-            'time_window_end': f"{DELIVERY.working_hours_end:02d}:00",
-            'service_time_minutes': 0,
-            'priority': 'depot',
-            'address': 'LPG Depot - Central Distribution Center',
-            'area_type': 'depot'
-        }
-
-        # Add depot at the beginning
-        df = pd.concat([pd.DataFrame([depot_data]), df], ignore_index=True)
+        num_points = len(all_points)
+        coordinates = np.array(all_points, dtype=float).reshape(-1, 2)
+
+        window_starts, window_ends = self._generate_time_windows(num_points)
+        demands = self._generate_demands(num_points)
+        addresses = self._generate_addresses(num_urban, num_rural)
+
+        # Depot (center of operations) occupies row 0 of every column, so only
+        # one DataFrame is materialized. Compact dtypes: float32 keeps ~1 m of
+        # coordinate precision and time windows take only a few distinct values
+        def with_depot(depot_value, values, dtype=None):
+            return np.concatenate([[depot_value], values], dtype=dtype)
+
+        df = pd.DataFrame({
+            'id': np.arange(0, num_points + 1, dtype=np.int32),  # 0 is reserved for depot
+            'latitude': with_depot(GEOGRAPHIC.center_lat, coordinates[:, 0], np.float32),
+            'longitude': with_depot(GEOGRAPHIC.center_lon, coordinates[:, 1], np.float32),
+            'demand': with_depot(0, demands, np.int16),
+            'time_window_start': pd.Categorical(
+                with_depot(f"{DELIVERY.working_hours_start:02d}:00", window_starts)),
+            'time_window_end': pd.Categorical(
+                with_depot(f"{DELIVERY.working_hours_end:02d}:00", window_ends)),
+            'service_time_minutes': with_depot(0, self._calculate_service_times(demands), np.int16),
+            'priority': with_depot('depot', self._determine_priorities(num_points)),
+            'address': with_depot('LPG Depot - Central Distribution Center', addresses),
+            'area_type': ['depot'] + area_types
+        })
 
         return df
 
     def save_delivery_data(self, df: pd.DataFrame, filename: str = None) -> str:
-        """Save delivery data to CSV file"""
+        """Save delivery data to CSV file, or Parquet when filename ends in .parquet"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"delivery_data_{timestamp}.csv"
 
         filepath = get_generated_data_path(filename)
-        df.to_csv(filepath, index=False)
+        if filename.endswith('.parquet'):
+            df.to_parquet(filepath, index=False)
+        elif pa is not None:
+            # Arrow's multi-threaded C++ writer; categoricals are written as plain strings
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.cast(pa.schema([
+                pa.field(field.name, field.type.value_type) if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ]))
+            pacsv.write_csv(table, filepath)
+        else:
+            df.to_csv(filepath, index=False)
         return filepath
 
     def generate_scenario_summary(self, df: pd.DataFrame) -> Dict:
         """Generate summary statistics for the scenario"""
-        # Exclude depot from calculations
-        delivery_df = df[df['id'] != 0]
+        # Exclude depot from calculations; it is always row 0
+        delivery_df = df.iloc[1:]
 
         total_demand = delivery_df['demand'].sum()
         urban_count = (delivery_df['area_type'] == 'urban').sum()
@@ -265,8 +267,8 @@ class MockDataGenerator:
             'priority_distribution': priority_counts,
             'average_demand_per_delivery': total_demand / len(delivery_df) if len(delivery_df) > 0 else 0,
             'depot_location': {
-                'latitude': df[df['id'] == 0]['latitude'].iloc[0],
-                'longitude': df[df['id'] == 0]['longitude'].iloc[0]
+                'latitude': df['latitude'].iat[0],
+                'longitude': df['longitude'].iat[0]
             }
         }
 
@@ -5,17 +5,19 @@ Orchestrates the complete optimization workflow from data to solution
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any
 import time
 from datetime import datetime
 
 from ..data.mock_data_generator import MockDataGenerator
 from ..data.distance_matrix import DistanceMatrix
-from ..vrp_solver import VRPSolver
+from .vrp_solver import VRPSolver
 from ..utils.config import (
     DATA_GENERATION, OPTIMIZATION, DELIVERY,
     get_output_path
 )
+from ..utils.metrics import MetricsCalculator
+from ..utils.serialization import write_json, numpy_default
 
 
 class RouteOptimizer:
@@ -29,6 +31,12 @@ class RouteOptimizer:
         self.baseline_solution = None
         self.optimized_solution = None
         self.optimization_time = 0
+        self._scenario_stats = None
+        self._scenario_stats_source = None
+        self._delivery_records = []
+        self._delivery_records_source = None
+        # Per optimizer: the calculator keeps cost and baseline caches
+        self.metrics_calculator = MetricsCalculator()
 
     def generate_delivery_scenario(self, num_deliveries: int = None,
                                  save_data: bool = True) -> Tuple[pd.DataFrame, Dict]:
@@ -47,9 +55,13 @@ class RouteOptimizer:
         # Generate data
         generator = MockDataGenerator(seed=self.seed)
         delivery_data = generator.generate_delivery_data(num_deliveries)
+        self.delivery_data = delivery_data
 
-        # Create summary
-        summary = generator.generate_scenario_summary(delivery_data)
+        # Create summary from the same cached reductions reused for the results
+        summary = dict(self._get_scenario_statistics())
+        summary['average_demand_per_delivery'] = (
+            summary['total_demand'] / summary['total_deliveries'] if summary['total_deliveries'] > 0 else 0
+        )
 
         # Save data if requested
         if save_data:
@@ -58,7 +70,6 @@ class RouteOptimizer:
             filepath = generator.save_delivery_data(delivery_data, filename)
             summary['data_file'] = filepath
 
-        self.delivery_data = delivery_data
         return delivery_data, summary
 
     def calculate_distance_matrices(self, save_matrices: bool = True) -> Dict:
@@ -77,12 +88,11 @@ class RouteOptimizer:
         print("Calculating distance and time matrices...")
 
         # Create distance calculator
-        distance_calc = DistanceMatrix(self.delivery_data)
+        distance_calc = DistanceMatrix(self.delivery_data, seed=self.seed)
 
         # Compute matrices
         start_time = time.time()
-        self.distance_matrix = distance_calc.compute_distance_matrix()
-        self.time_matrix = distance_calc.compute_time_matrix()
+        self.distance_matrix, self.time_matrix = distance_calc.compute_matrices()
         matrix_time = time.time() - start_time
 
         # Get statistics
@@ -121,20 +131,21 @@ class RouteOptimizer:
         # Create VRP solver
         solver = VRPSolver(self.delivery_data, self.distance_matrix, self.time_matrix)
 
-        # Run optimization
-        self.optimized_solution = solver.solve_vrp(
-            num_vehicles=num_vehicles,
-            time_limit_seconds=time_limit_seconds,
-            include_time_windows=include_time_windows
-        )
-
-        # Create baseline if requested
+        # Create baseline if requested; it also warm-starts the search
         if create_baseline:
             print("Creating baseline solution for comparison...")
             self.baseline_solution = solver.create_baseline_solution()
         else:
             self.baseline_solution = None
 
+        # Run optimization
+        self.optimized_solution = solver.solve_vrp(
+            num_vehicles=num_vehicles,
+            time_limit_seconds=time_limit_seconds,
+            include_time_windows=include_time_windows,
+            initial_solution=self.baseline_solution
+        )
+
         self.optimization_time = time.time() - start_time
 
         # Create comprehensive results
@@ -167,35 +178,39 @@ class RouteOptimizer:
         return results
 
     def _get_scenario_statistics(self) -> Dict:
-        """Get statistics about the current scenario"""
+        """Get statistics about the current scenario, computed once per delivery dataset"""
         if self.delivery_data is None:
             return {}
+        if self._scenario_stats_source is self.delivery_data:
+            return self._scenario_stats
 
-        # Exclude depot from statistics
-        delivery_df = self.delivery_data[self.delivery_data['id'] != 0]
+        # Exclude depot from statistics; it is always row 0
+        delivery_df = self.delivery_data.iloc[1:]
+        area_counts = delivery_df['area_type'].value_counts()
 
         stats = {
             'total_deliveries': len(delivery_df),
             'total_demand': int(delivery_df['demand'].sum()),
-            'urban_deliveries': int((delivery_df['area_type'] == 'urban').sum()),
-            'rural_deliveries': int((delivery_df['area_type'] == 'rural').sum()),
+            'urban_deliveries': int(area_counts.get('urban', 0)),
+            'rural_deliveries': int(area_counts.get('rural', 0)),
             'priority_distribution': delivery_df['priority'].value_counts().to_dict(),
             'depot_location': {
-                'latitude': float(self.delivery_data[self.delivery_data['id'] == 0]['latitude'].iloc[0]),
-                'longitude': float(self.delivery_data[self.delivery_data['id'] == 0]['longitude'].iloc[0])
+                'latitude': float(self.delivery_data['latitude'].iat[0]),
+                'longitude': float(self.delivery_data['longitude'].iat[0])
             }
         }
 
         # Time window statistics
-        delivery_df['time_window_start_minutes'] = delivery_df['time_window_start'].apply(
-            lambda x: int(x.split(':')[0]) * 60 + int(x.split(':')[1])
-        )
+        time_parts = delivery_df['time_window_start'].str.split(':', n=1, expand=True).astype(np.int16)
+        window_start_minutes = time_parts[0] * 60 + time_parts[1]
         stats['time_window_stats'] = {
-            'earliest_start': int(delivery_df['time_window_start_minutes'].min()),
-            'latest_start': int(delivery_df['time_window_start_minutes'].max()),
+            'earliest_start': int(window_start_minutes.min()),
+            'latest_start': int(window_start_minutes.max()),
             'average_window_duration': DATA_GENERATION.time_window_duration_hours * 60
         }
 
+        self._scenario_stats = stats
+        self._scenario_stats_source = self.delivery_data
         return stats
 
     def _calculate_improvement_metrics(self) -> Dict:
@@ -215,11 +230,8 @@ class RouteOptimizer:
         vehicle_reduction_percent = (vehicle_reduction / baseline_vehicles) * 100 if baseline_vehicles > 0 else 0
 
         # Calculate cost savings
-        from ..utils.metrics import MetricsCalculator
-        calculator = MetricsCalculator()
-
-        baseline_costs = calculator.calculate_route_costs(self.baseline_solution)
-        optimized_costs = calculator.calculate_route_costs(self.optimized_solution)
+        baseline_costs = self.metrics_calculator.calculate_route_costs(self.baseline_solution)
+        optimized_costs = self.metrics_calculator.calculate_route_costs(self.optimized_solution)
 
         cost_savings = baseline_costs['total_cost'] - optimized_costs['total_cost']
         cost_savings_percent = (cost_savings / baseline_costs['total_cost']) * 100 if baseline_costs['total_cost'] > 0 else 0
@@ -247,31 +259,12 @@ class RouteOptimizer:
 
     def _save_optimization_results(self, results: Dict) -> None:
         """Save optimization results to file"""
-        import json
-
         timestamp = int(time.time())
         filename = f"optimization_results_{timestamp}.json"
         filepath = get_output_path(filename)
 
-        # Convert numpy types to Python types for JSON serialization
-        def convert_numpy_types(obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, dict):
-                return {key: convert_numpy_types(value) for key, value in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(item) for item in obj]
-            else:
-                return obj
-
-        serializable_results = convert_numpy_types(results)
-
-        with open(filepath, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
+        # NumPy values are serialized natively by orjson (or via numpy_default) without a copy pass
+        write_json(filepath, results, default=numpy_default)
 
         results['results_file'] = filepath
 
@@ -347,13 +340,23 @@ class RouteOptimizer:
                   f"{route['total_distance']:.1f} km, "
                   f"{route['total_demand']} cylinders")
 
+    def _get_delivery_records(self) -> List[Dict]:
+        """Delivery points as one dict per row, converted once per delivery DataFrame"""
+        if self._delivery_records_source is not self.delivery_data:
+            self._delivery_records = (self.delivery_data.to_dict('records')
+                                      if self.delivery_data is not None and len(self.delivery_data)
+                                      else [])
+            self._delivery_records_source = self.delivery_data
+        # Copy the outer list so callers can reorder or filter it freely
+        return list(self._delivery_records)
+
     def get_solution_for_visualization(self) -> Dict:
         """Get solution data formatted for visualization"""
         if not self.optimized_solution:
             return {}
 
         viz_data = {
-            'delivery_points': self.delivery_data.to_dict('records') if self.delivery_data is not None else [],
+            'delivery_points': self._get_delivery_records(),
             'optimized_routes': self.optimized_solution.get('routes', []),
             'baseline_routes': self.baseline_solution.get('routes', []) if self.baseline_solution else [],
             'improvement_metrics': self.optimized_solution.get('improvement_metrics', {}),
@@ -16,24 +16,107 @@ from ..utils.config import (
     DELIVERY, OPTIMIZATION, GEOGRAPHIC,
     get_output_path
 )
+from ..utils.jit import njit, NUMBA_AVAILABLE
+from ..utils.serialization import write_json, numpy_default
+from ..utils.time_windows import hhmm_to_minutes
+
+# OR-Tools works on int64 arc costs: distances are passed as meters and
+# times as seconds so rounding stays well below the input precision
+DISTANCE_SCALE = 1000  # km -> m
+TIME_SCALE = 60  # minutes -> s
+
+# Config names mapped to OR-Tools enum values, resolved once at import
+_FIRST_SOLUTION_STRATEGIES = {
+    name: getattr(routing_enums_pb2.FirstSolutionStrategy, name)
+    for name in ("PATH_CHEAPEST_ARC", "PARALLEL_CHEAPEST_INSERTION", "AUTOMATIC")
+}
+_LOCAL_SEARCH_METAHEURISTICS = {
+    "GUIDED_LOCAL_SEARCH": routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+}
+
+
+@njit(cache=True)
+def _greedy_routes_numba(dist, demands, capacity, fill_limit):
+    """
+    Greedy nearest-neighbor routes from depot 0: each vehicle takes the nearest
+    unvisited stop that still fits until it is fill_limit full. Returns the flat
+    stop array, route offsets into it and each route's round-trip distance
+    """
+    n = dist.shape[0]
+    unvisited = np.ones(n, dtype=np.bool_)
+    unvisited[0] = False
+    stops = np.empty(max(n - 1, 0), dtype=np.int64)
+    offsets = np.zeros(n, dtype=np.int64)
+    route_distances = np.zeros(n, dtype=np.float64)
+    num_stops = 0
+    num_routes = 0
+
+    while num_stops < n - 1:
+        current = 0
+        load = 0
+        route_distance = 0.0
+        route_start = num_stops
+        while load < fill_limit:
+            nearest = -1
+            nearest_distance = np.inf
+            for j in range(1, n):
+                if unvisited[j] and load + demands[j] <= capacity and dist[current, j] < nearest_distance:
+                    nearest = j
+                    nearest_distance = dist[current, j]
+            if nearest < 0:
+                break
+            stops[num_stops] = nearest
+            num_stops += 1
+            route_distance += nearest_distance
+            load += demands[nearest]
+            unvisited[nearest] = False
+            current = nearest
+
+        if num_stops == route_start:
+            break  # Remaining demands exceed vehicle capacity
+        route_distances[num_routes] = route_distance + dist[current, 0]
+        num_routes += 1
+        offsets[num_routes] = num_stops
+
+    return stops[:num_stops], offsets[:num_routes + 1], route_distances[:num_routes]
 
 
 class VRPSolver:
     """Vehicle Routing Problem solver using Google OR-Tools"""
 
     def __init__(self, delivery_data: pd.DataFrame, distance_matrix: np.ndarray,
-                 time_matrix: np.ndarray):
+                 time_matrix: np.ndarray, verbose: bool = False):
         self.delivery_data = delivery_data
+        self.verbose = verbose
         self.distance_matrix = distance_matrix
         self.time_matrix = time_matrix
         self.num_locations = len(delivery_data)
 
-        # Extract demands (excluding depot)
-        self.demands = [0] + delivery_data[delivery_data['id'] != 0]['demand'].tolist()
+        # Extract demands (depot, always row 0, has none) as an int array once;
+        # the list form is what OR-Tools consumes
+        self.demand_array = delivery_data['demand'].to_numpy(dtype=np.int64, copy=True)
+        self.demand_array[0] = 0
+        self.demands = self.demand_array.tolist()
+
+        # Integer meter/second matrices, quantized once; OR-Tools only accepts
+        # nested lists, which are built from these on first solve
+        self.distance_matrix_m = np.rint(distance_matrix * DISTANCE_SCALE).astype(np.int64)
+        self.time_matrix_s = np.rint(time_matrix * TIME_SCALE).astype(np.int64)
+        self._distance_list = None
+        self._time_list = None
+
+        # Time windows in minutes since midnight, parsed once for all rows
+        self.window_start_minutes = hhmm_to_minutes(delivery_data['time_window_start'])
+        self.window_end_minutes = hhmm_to_minutes(delivery_data['time_window_end'])
+        self._time_windows = None
+
+        # (manager, routing) per (num_vehicles, include_time_windows)
+        self._routing_models = {}
 
         # Solution storage
         self.solution = None
         self.routes = None
+        self._route_totals = None
         self.objective_value = None
         self.solver_time = 0
 
@@ -43,9 +126,11 @@ class VRPSolver:
             num_vehicles = min(OPTIMIZATION.max_vehicles,
                              max(3, self.num_locations // 5))  # At least 3 vehicles
 
+        if self._distance_list is None:
+            self._distance_list = self.distance_matrix_m.tolist()
+
         data = {
-            'distance_matrix': self.distance_matrix.tolist(),
-            'time_matrix': self.time_matrix.tolist(),
+            'distance_matrix': self._distance_list,
             'demands': self.demands,
             'vehicle_capacities': [DELIVERY.vehicle_capacity] * num_vehicles,
             'num_vehicles': num_vehicles,
@@ -56,24 +141,11 @@ class VRPSolver:
 
     def _create_time_windows(self) -> List[Tuple[int, int]]:
         """Create time windows for all locations in minutes since start of day"""
-        time_windows = []
-
-        for _, row in self.delivery_data.iterrows():
-            start_time = row['time_window_start']
-            end_time = row['time_window_end']
-
-            # Parse time strings to minutes since midnight
-            start_minutes = self._time_to_minutes(start_time)
-            end_minutes = self._time_to_minutes(end_time)
-
-            time_windows.append((start_minutes, end_minutes))
+        if self._time_windows is None:
+            self._time_windows = list(zip(self.window_start_minutes.tolist(),
+                                          self.window_end_minutes.tolist()))
 
-        return time_windows
-
-    def _time_to_minutes(self, time_str: str) -> int:
-        """Convert time string to minutes since midnight"""
-        hour, minute = map(int, time_str.split(':'))
-        return hour * 60 + minute
+        return self._time_windows
 
     def _minutes_to_time_str(self, minutes: int) -> str:
         """Convert minutes since midnight to time string"""
@@ -83,6 +155,8 @@ class VRPSolver:
 
     def _print_solution(self, data, manager, routing, solution):
         """Print solution on console."""
+        if not self.verbose:
+            return
         print(f'Objective: {solution.ObjectiveValue()}')
         max_route_distance = 0
         for vehicle_id in range(data['num_vehicles']):
@@ -103,7 +177,8 @@ class VRPSolver:
         print(f'Maximum of the route distances: {max_route_distance}m')
 
     def solve_vrp(self, num_vehicles: int = None, time_limit_seconds: int = None,
-                  include_time_windows: bool = True) -> Dict[str, Any]:
+                  include_time_windows: bool = True,
+                  initial_solution: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Solve the Vehicle Routing Problem
 
@@ -111,6 +186,8 @@ class VRPSolver:
             num_vehicles: Number of vehicles to use
             time_limit_seconds: Time limit for solver
             include_time_windows: Whether to include time window constraints
+            initial_solution: Solution dict (e.g. from create_baseline_solution)
+                whose routes warm-start the search
 
         Returns:
             Dictionary containing solution details
@@ -120,34 +197,102 @@ class VRPSolver:
         # Create data model
         data = self._create_data_model(num_vehicles)
 
+        # Routing models are reused across calls with the same shape
+        model_key = (data['num_vehicles'], include_time_windows)
+        fresh_model = model_key not in self._routing_models
+        if fresh_model:
+            self._routing_models[model_key] = self._build_routing_model(data, include_time_windows)
+        manager, routing = self._routing_models[model_key]
+
+        # Setting first solution heuristic
+        search_parameters = pywrapcp.DefaultRoutingSearchParameters()
+
+        # Set first solution strategy
+        if OPTIMIZATION.first_solution_strategy in _FIRST_SOLUTION_STRATEGIES:
+            search_parameters.first_solution_strategy = (
+                _FIRST_SOLUTION_STRATEGIES[OPTIMIZATION.first_solution_strategy])
+
+        # Set local search metaheuristic
+        if OPTIMIZATION.local_search_metaheuristic in _LOCAL_SEARCH_METAHEURISTICS:
+            search_parameters.local_search_metaheuristic = (
+                _LOCAL_SEARCH_METAHEURISTICS[OPTIMIZATION.local_search_metaheuristic])
+
+        # Extend the local search neighborhoods beyond the defaults
+        if OPTIMIZATION.enable_extended_operators:
+            operators = search_parameters.local_search_operators
+            operators.use_cross_exchange = pywrapcp.BOOL_TRUE
+            operators.use_relocate_neighbors = pywrapcp.BOOL_TRUE
+            operators.use_relocate_expensive_chain = pywrapcp.BOOL_TRUE
+
+        # Set time limit
+        time_limit = time_limit_seconds or OPTIMIZATION.solver_time_limit_seconds
+        search_parameters.time_limit.FromSeconds(time_limit)
+
+        search_parameters.log_search = False  # Keep solver logging off the hot path
+
+        # Solve the problem
+        if self.verbose:
+            print(f"Starting VRP solver with {data['num_vehicles']} vehicles...")
+            print(f"Time limit: {time_limit} seconds")
+
+        # Warm-start from the given routes when they form a valid assignment;
+        # OR-Tools only accepts this on a model that has not been solved yet
+        initial_assignment = None
+        if fresh_model and initial_solution and initial_solution.get('routes'):
+            initial_routes = [[manager.NodeToIndex(node) for node in route['stops'] if node != 0]
+                              for route in initial_solution['routes']]
+            if len(initial_routes) <= data['num_vehicles']:
+                routing.CloseModelWithParameters(search_parameters)
+                initial_assignment = routing.ReadAssignmentFromRoutes(initial_routes, True)
+
+        if initial_assignment is not None:
+            if self.verbose:
+                print("Warm-starting from initial routes")
+            solution = routing.SolveFromAssignmentWithParameters(initial_assignment, search_parameters)
+        else:
+            solution = routing.SolveWithParameters(search_parameters)
+
+        # Calculate solver time
+        self.solver_time = time.time() - start_time
+
+        # Process solution
+        if solution:
+            if self.verbose:
+                print(f'Solution found in {self.solver_time:.2f} seconds!')
+            self.solution = solution
+            self.objective_value = solution.ObjectiveValue()
+            self.routes = self._extract_routes(data, manager, routing, solution)
+
+            return self._create_solution_dict(data, manager, routing, solution)
+        else:
+            if self.verbose:
+                print('No solution found!')
+            return {'status': 'no_solution', 'solver_time': self.solver_time}
+
+    def _build_routing_model(self, data: Dict, include_time_windows: bool):
+        """Create the index manager and routing model with all dimensions"""
         # Create the routing index manager
         manager = pywrapcp.RoutingIndexManager(
             len(data['distance_matrix']),
             data['num_vehicles'],
             data['depot'])
 
-        # Create Routing Model
-        routing = pywrapcp.RoutingModel(manager)
+        # Create Routing Model; cache every arc evaluation and collapse the
+        # per-vehicle cost model since all vehicles share one arc cost
+        model_parameters = pywrapcp.DefaultRoutingModelParameters()
+        model_parameters.max_callback_cache_size = self.num_locations * self.num_locations
+        model_parameters.reduce_vehicle_cost_model = True
+        routing = pywrapcp.RoutingModel(manager, model_parameters)
 
-        # Create and register a transit callback
-        def distance_callback(from_index, to_index):
-            """Returns the distance between the two nodes."""
-            from_node = manager.IndexToNode(from_index)
-            to_node = manager.IndexToNode(to_index)
-            return data['distance_matrix'][from_node][to_node]
-
-        transit_callback_index = routing.RegisterTransitCallback(distance_callback)
+        # Register transits as matrices/vectors so arc evaluation stays in C++
+        # instead of calling back into Python for every arc
+        transit_callback_index = routing.RegisterTransitMatrix(data['distance_matrix'])
 
         # Define cost of each arc
         routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
 
         # Add Capacity constraint
-        def demand_callback(from_index):
-            """Returns the demand of the node."""
-            from_node = manager.IndexToNode(from_index)
-            return data['demands'][from_node]
-
-        demand_callback_index = routing.RegisterUnaryTransitCallback(demand_callback)
+        demand_callback_index = routing.RegisterUnaryTransitVector(data['demands'])
         routing.AddDimensionWithVehicleCapacity(
             demand_callback_index,
             0,  # null capacity slack
@@ -159,19 +304,17 @@ class VRPSolver:
         if include_time_windows:
             time_windows = self._create_time_windows()
 
-            def time_callback(from_index, to_index):
-                """Returns the travel time between the two nodes."""
-                from_node = manager.IndexToNode(from_index)
-                to_node = manager.IndexToNode(to_index)
-                return data['time_matrix'][from_node][to_node]
-
-            time_callback_index = routing.RegisterTransitCallback(time_callback)
+            # Only time-window models need the travel times; convert them once
+            if self._time_list is None:
+                self._time_list = self.time_matrix_s.tolist()
+            time_callback_index = routing.RegisterTransitMatrix(self._time_list)
 
-            # Add time dimension
+            # Add time dimension (seconds since the depot opens)
+            day_start = DELIVERY.working_hours_start * 60
             routing.AddDimension(
                 time_callback_index,
-                30,  # allow waiting time
-                DELIVERY.max_route_duration_hours * 60,  # maximum time per vehicle
+                30 * TIME_SCALE,  # allow waiting time
+                (DELIVERY.working_hours_end * 60 - day_start) * TIME_SCALE,  # end of working day
                 False,  # Don't force start cumul to zero
                 'Time')
 
@@ -182,77 +325,37 @@ class VRPSolver:
                 if location_idx == 0:  # Skip depot
                     continue
                 index = manager.NodeToIndex(location_idx)
-                time_dimension.CumulVar(index).SetRange(time_window[0], time_window[1])
+                time_dimension.CumulVar(index).SetRange((time_window[0] - day_start) * TIME_SCALE,
+                                                        (time_window[1] - day_start) * TIME_SCALE)
 
-            # Add time window constraints for depot start and end
+            # Add time window constraints for depot start and end, and cap
+            # each vehicle's route duration
             depot_idx = 0
+            max_route_time = int(DELIVERY.max_route_duration_hours * 60 * TIME_SCALE)
             for vehicle_id in range(data['num_vehicles']):
                 index = routing.Start(vehicle_id)
                 time_dimension.CumulVar(index).SetRange(
-                    time_windows[depot_idx][0],
-                    time_windows[depot_idx][1])
-
-        # Setting first solution heuristic
-        search_parameters = pywrapcp.DefaultRoutingSearchParameters()
-
-        # Set first solution strategy
-        if OPTIMIZATION.first_solution_strategy == "PATH_CHEAPEST_ARC":
-            search_parameters.first_solution_strategy = (
-                routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC)
+                    (time_windows[depot_idx][0] - day_start) * TIME_SCALE,
+                    (time_windows[depot_idx][1] - day_start) * TIME_SCALE)
+                time_dimension.SetSpanUpperBoundForVehicle(max_route_time, vehicle_id)
 
-        # Set local search metaheuristic
-        if OPTIMIZATION.local_search_metaheuristic == "GUIDED_LOCAL_SEARCH":
-            search_parameters.local_search_metaheuristic = (
-                routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH)
-
-        # Set time limit
-        time_limit = time_limit_seconds or OPTIMIZATION.solver_time_limit_seconds
-        search_parameters.time_limit.FromSeconds(time_limit)
-
-        # Solve the problem
-        print(f"Starting VRP solver with {data['num_vehicles']} vehicles...")
-        print(f"Time limit: {time_limit} seconds")
-
-        solution = routing.SolveWithParameters(search_parameters)
-
-        # Calculate solver time
-        self.solver_time = time.time() - start_time
-
-        # Process solution
-        if solution:
-            print(f'Solution found in {self.solver_time:.2f} seconds!')
-            self.solution = solution
-            self.objective_value = solution.ObjectiveValue()
-            self.routes = self._extract_routes(data, manager, routing, solution)
-
-            return self._create_solution_dict(data, manager, routing, solution)
-        else:
-            print('No solution found!')
-            return {'status': 'no_solution', 'solver_time': self.solver_time}
+        return manager, routing
 
     def _extract_routes(self, data, manager, routing, solution) -> List[Dict]:
-        """Extract routes from solution"""
+        """Extract routes from solution, collecting per-route totals in the same pass"""
         routes = []
+        # One slot per vehicle; trimmed to the routes actually used below
+        route_distances = np.zeros(data['num_vehicles'], dtype=float)
+        route_demands = np.zeros(data['num_vehicles'], dtype=np.int64)
+        route_deliveries = np.zeros(data['num_vehicles'], dtype=np.int64)
 
         for vehicle_id in range(data['num_vehicles']):
-            route = {
-                'vehicle_id': vehicle_id,
-                'stops': [],
-                'total_distance': 0,
-                'total_demand': 0,
-                'total_time': 0
-            }
-
             index = routing.Start(vehicle_id)
+            stops = []
             route_distance = 0
-            route_demand = 0
 
             while not routing.IsEnd(index):
-                node_index = manager.IndexToNode(index)
-                route['stops'].append(node_index)
-
-                if node_index != 0:  # Not depot
-                    route_demand += data['demands'][node_index]
+                stops.append(manager.IndexToNode(index))
 
                 previous_index = index
                 index = solution.Value(routing.NextVar(index))
@@ -262,23 +365,38 @@ class VRPSolver:
                         previous_index, index, vehicle_id)
 
             # Add final return to depot
-            if len(route['stops']) > 1:  # Only if vehicle actually made deliveries
-                route['total_distance'] = route_distance
-                route['total_demand'] = route_demand
-                route['stops'].append(0)  # Return to depot
-                routes.append(route)
-
+            if len(stops) > 1:  # Only if vehicle actually made deliveries
+                route_demand = int(self.demand_array[stops].sum())  # depot demand is zero
+                routes.append({
+                    'vehicle_id': vehicle_id,
+                    'stops': stops + [0],  # Return to depot
+                    'total_distance': route_distance / DISTANCE_SCALE,  # back to km
+                    'total_demand': route_demand,
+                    'total_time': 0
+                })
+                used = len(routes) - 1
+                route_distances[used] = route_distance / DISTANCE_SCALE
+                route_demands[used] = route_demand
+                route_deliveries[used] = len(stops) - 1
+
+        num_routes = len(routes)
+        self._route_totals = {
+            'distance': route_distances[:num_routes],
+            'demand': route_demands[:num_routes],
+            'deliveries': route_deliveries[:num_routes]
+        }
         return routes
 
     def _create_solution_dict(self, data, manager, routing, solution) -> Dict:
         """Create comprehensive solution dictionary"""
+        totals = self._route_totals
         solution_dict = {
             'status': 'optimal',
             'objective_value': self.objective_value,
             'solver_time_seconds': self.solver_time,
-            'num_vehicles_used': len([r for r in self.routes if r['stops']]),
-            'total_distance': sum(r['total_distance'] for r in self.routes),
-            'total_demand_served': sum(r['total_demand'] for r in self.routes),
+            'num_vehicles_used': len(self.routes),
+            'total_distance': float(totals['distance'].sum()),
+            'total_demand_served': int(totals['demand'].sum()),
             'routes': self.routes,
             'unassigned_customers': [],
             'statistics': self._calculate_solution_statistics()
@@ -287,98 +405,109 @@ class VRPSolver:
         return solution_dict
 
     def _calculate_solution_statistics(self) -> Dict:
-        """Calculate detailed statistics about the solution"""
+        """Calculate detailed statistics about the solution from the per-route totals"""
         if not self.routes:
             return {}
 
-        route_distances = [r['total_distance'] for r in self.routes if r['stops']]
-        route_demands = [r['total_demand'] for r in self.routes if r['stops']]
-        route_stops = [len(r['stops']) - 2 for r in self.routes if r['stops']]  # Exclude depot returns
+        distances = self._route_totals['distance']
+        demands = self._route_totals['demand']
+        deliveries = self._route_totals['deliveries']
 
         stats = {
             'vehicles_used': len(self.routes),
-            'total_distance_km': sum(route_distances),
-            'average_distance_per_route': sum(route_distances) / len(route_distances) if route_distances else 0,
-            'max_distance_route': max(route_distances) if route_distances else 0,
-            'min_distance_route': min(route_distances) if route_distances else 0,
-            'total_deliveries': sum(route_stops),
-            'average_deliveries_per_route': sum(route_stops) / len(route_stops) if route_stops else 0,
-            'total_demand_served': sum(route_demands),
-            'average_demand_per_route': sum(route_demands) / len(route_demands) if route_demands else 0,
-            'route_utilization_percent': sum(route_demands) / (len(self.routes) * DELIVERY.vehicle_capacity) * 100
+            'total_distance_km': float(distances.sum()),
+            'average_distance_per_route': float(distances.mean()),
+            'max_distance_route': float(distances.max()),
+            'min_distance_route': float(distances.min()),
+            'total_deliveries': int(deliveries.sum()),
+            'average_deliveries_per_route': float(deliveries.mean()),
+            'total_demand_served': int(demands.sum()),
+            'average_demand_per_route': float(demands.mean()),
+            'route_utilization_percent': float(demands.sum() / (len(self.routes) * DELIVERY.vehicle_capacity) * 100)
         }
 
         return stats
 
     def create_baseline_solution(self) -> Dict:
         """Create a simple greedy baseline solution for comparison"""
-        print("Creating baseline solution using greedy nearest neighbor...")
+        if self.verbose:
+            print("Creating baseline solution using greedy nearest neighbor...")
+
+        # Simple nearest neighbor from depot; routes come back as a flat stop
+        # array split by offsets, plus each route's distance
+        fill_limit = DELIVERY.vehicle_capacity * 0.9
+        if NUMBA_AVAILABLE:
+            stops, offsets, route_distances = _greedy_routes_numba(
+                self.distance_matrix, self.demand_array, DELIVERY.vehicle_capacity, fill_limit
+            )
+        else:
+            stops, offsets, route_distances = self._greedy_routes_numpy(fill_limit)
 
-        # Simple nearest neighbor from depot
-        unvisited = set(range(1, self.num_locations))  # Exclude depot
-        routes = []
-        vehicle_id = 0
+        # Every route has at least one stop, so reduceat splits demand cleanly by route
+        route_demands = (np.add.reduceat(self.demand_array[stops], offsets[:-1])
+                         if len(route_distances) else np.zeros(0, dtype=np.int64))
 
-        while unvisited:
-            route = {
+        routes = []
+        for vehicle_id in range(len(route_distances)):
+            route_stops = stops[offsets[vehicle_id]:offsets[vehicle_id + 1]]
+            routes.append({
                 'vehicle_id': vehicle_id,
-                'stops': [0],  # Start at depot
-                'total_distance': 0,
-                'total_demand': 0
-            }
+                'stops': [0] + route_stops.tolist() + [0],
+                'total_distance': float(route_distances[vehicle_id]),
+                'total_demand': int(route_demands[vehicle_id])
+            })
 
-            current = 0  # Start at depot
-            current_capacity = 0
+        baseline_stats = {
+            'total_distance': float(route_distances.sum()),
+            'total_demand_served': int(route_demands.sum()),
+            'num_vehicles_used': len(routes),
+            'routes': routes
+        }
 
-            while unvisited and current_capacity < DELIVERY.vehicle_capacity * 0.9:
-                # Find nearest unvisited location
-                nearest = None
-                nearest_distance = float('inf')
+        return baseline_stats
 
-                for location in unvisited:
-                    distance = self.distance_matrix[current][location]
-                    if distance < nearest_distance:
-                        nearest = location
-                        nearest_distance = distance
+    def _greedy_routes_numpy(self, fill_limit: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """NumPy fallback for _greedy_routes_numba with the same outputs"""
+        demands = self.demand_array
+        unvisited_mask = np.ones(self.num_locations, dtype=bool)
+        unvisited_mask[0] = False  # Exclude depot
+        stops = []
+        offsets = [0]
+        route_distances = []
 
-                if nearest is None:
-                    break
+        while unvisited_mask.any():
+            current = 0  # Start at depot
+            current_capacity = 0
+            route_distance = 0.0
 
-                # Check capacity constraint
-                demand = self.demands[nearest]
-                if current_capacity + demand > DELIVERY.vehicle_capacity:
+            while current_capacity < fill_limit:
+                # Nearest unvisited location that still fits in the vehicle
+                candidates = unvisited_mask & (demands <= DELIVERY.vehicle_capacity - current_capacity)
+                if not candidates.any():
                     break
+                row = np.where(candidates, self.distance_matrix[current], np.inf)
+                nearest = int(row.argmin())
 
                 # Add to route
-                route['stops'].append(nearest)
-                route['total_distance'] += nearest_distance
-                route['total_demand'] += demand
-                current_capacity += demand
+                stops.append(nearest)
+                route_distance += float(row[nearest])
+                current_capacity += int(demands[nearest])
 
-                unvisited.remove(nearest)
+                unvisited_mask[nearest] = False
                 current = nearest
 
-            # Return to depot
-            if len(route['stops']) > 1:
-                return_distance = self.distance_matrix[current][0]
-                route['stops'].append(0)
-                route['total_distance'] += return_distance
-                routes.append(route)
-                vehicle_id += 1
+            if len(stops) == offsets[-1]:
+                break  # Remaining demands exceed vehicle capacity
 
-        baseline_stats = {
-            'total_distance': sum(r['total_distance'] for r in routes),
-            'total_demand_served': sum(r['total_demand'] for r in routes),
-            'num_vehicles_used': len(routes),
-            'routes': routes
-        }
+            # Return to depot
+            route_distances.append(route_distance + float(self.distance_matrix[current, 0]))
+            offsets.append(len(stops))
 
-        return baseline_stats
+        return (np.array(stops, dtype=np.int64), np.array(offsets, dtype=np.int64),
+                np.array(route_distances))
 
     def save_solution(self, filename: str = None) -> str:
         """Save solution to JSON file"""
-        import json
-
         if filename is None:
             timestamp = int(time.time())
             filename = f"vrp_solution_{timestamp}.json"
@@ -393,8 +522,7 @@ class VRPSolver:
             'timestamp': datetime.now().isoformat()
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(solution_data, f, indent=2)
+        write_json(filepath, solution_data, default=numpy_default)
 
         return filepath
 
@@ -413,7 +541,7 @@ def main():
     distance_matrix, time_matrix = distance_calc.get_matrices()
 
     # Solve VRP
-    solver = VRPSolver(delivery_data, distance_matrix, time_matrix)
+    solver = VRPSolver(delivery_data, distance_matrix, time_matrix, verbose=True)
     solution = solver.solve_vrp()
 
     print("\nSolution Summary:")
@@ -83,8 +83,9 @@ class OptimizationConfig:
     """OR-Tools optimization configuration"""
     # Solver parameters
     solver_time_limit_seconds: int = 30
-    first_solution_strategy: str = "PATH_CHEAPEST_ARC"
+    first_solution_strategy: str = "PARALLEL_CHEAPEST_INSERTION"
     local_search_metaheuristic: str = "GUIDED_LOCAL_SEARCH"
+    enable_extended_operators: bool = True  # cross exchange and chain relocation moves
 
     # Solution parameters
     max_vehicles: int = 10
@@ -131,6 +132,7 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 GENERATED_DATA_DIR = os.path.join(DATA_DIR, "generated")
 OUTPUT_DATA_DIR = os.path.join(DATA_DIR, "output")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
 
 
 def get_output_path(filename: str) -> str:
@@ -140,4 +142,9 @@ def get_output_path(filename: str) -> str:
 
 def get_generated_data_path(filename: str) -> str:
     """Get full path for generated data file"""
-    return os.path.join(GENERATED_DATA_DIR, filename)
\ No newline at end of file
+    return os.path.join(GENERATED_DATA_DIR, filename)
+
+
+def get_cache_path(filename: str) -> str:
+    """Get full path for a disposable cache file"""
+    return os.path.join(CACHE_DIR, filename)
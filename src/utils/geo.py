@@ -0,0 +1,42 @@
+"""
+Great-circle distance kernels
+Compiled with Numba when it is installed, plain Python/NumPy otherwise
+"""
+
+import math
+import numpy as np
+
+from .jit import njit
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True, fastmath=True)
+def haversine_rad_km(phi1: float, lambda1: float, phi2: float, lambda2: float) -> float:
+    """Great-circle distance in km between two points given in radians"""
+    a = (math.sin((phi2 - phi1) / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin((lambda2 - lambda1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@njit(cache=True, fastmath=True)
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two points given in degrees"""
+    return haversine_rad_km(math.radians(lat1), math.radians(lon1),
+                            math.radians(lat2), math.radians(lon2))
+
+
+def haversine_km_array(phi1, lambda1, phi2, lambda2) -> np.ndarray:
+    """Great-circle distances in km between points given in radians (broadcasts)"""
+    a = (np.sin((phi2 - phi1) / 2) ** 2 +
+         np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def initial_bearing_deg(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Initial great-circle bearing in degrees clockwise from north; inputs in degrees (broadcasts)"""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dlambda = np.radians(np.subtract(lon2, lon1))
+    y = np.sin(dlambda) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(dlambda)
+    return np.degrees(np.arctan2(y, x))
@@ -5,10 +5,113 @@ Calculates cost, time, efficiency, and performance metrics
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 
 from .config import DELIVERY
+from .jit import njit, prange, NUMBA_AVAILABLE
+from .time_windows import hhmm_to_minutes
+
+CO2_LB_PER_GALLON = 19.6  # ~19.6 lb CO2 per gallon gasoline
+AVERAGE_SPEED_KMH = 45  # Mixed urban/rural average used for route time estimates
+SERVICE_MINUTES_PER_DELIVERY = 20  # Average time spent at each delivery stop
+
+
+def _index_windows(ids, window_start, window_end, service) -> Tuple[np.ndarray, ...]:
+    """
+    Arrays of (row, window start, window end, service minutes) where row
+    maps a location id to its position in the others, or -1 if unknown
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    row_of_id = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int64)
+    row_of_id[ids] = np.arange(len(ids))
+    return (row_of_id, np.asarray(window_start), np.asarray(window_end),
+            np.asarray(service, dtype=np.float64))
+
+
+@njit(cache=True)
+def _simulate_route_numba(stops, time_matrix, row_of_id, window_start, window_end, service, day_start):
+    """
+    Drive a route from day_start, waiting at early stops. Returns per-delivery
+    arrival and window end arrays plus total wait and service minutes; stops
+    missing from the delivery data only add travel time
+    """
+    n = stops.shape[0] - 2
+    arrival = np.empty(n, dtype=np.float64)
+    end = np.full(n, np.inf)
+    wait_time = 0.0
+    service_time = 0.0
+    current_time = float(day_start)
+    for k in range(n):
+        location_id = stops[k + 1]
+        current_time += time_matrix[stops[k], location_id]
+        arrival[k] = current_time
+        if location_id >= row_of_id.shape[0] or row_of_id[location_id] < 0:
+            continue
+        row = row_of_id[location_id]
+        end[k] = window_end[row]
+        if current_time < window_start[row]:
+            wait_time += window_start[row] - current_time
+            current_time = window_start[row]
+        current_time += service[row]
+        service_time += service[row]
+    return arrival, end, wait_time, service_time
+
+
+@njit(parallel=True, cache=True)
+def _simulate_routes_numba(stops, offsets, time_matrix, row_of_id, window_start, window_end,
+                           service, day_start):
+    """
+    _simulate_route_numba over many routes in parallel. Route r is
+    stops[offsets[r]:offsets[r + 1]] with the depot at both ends; the arrival
+    and window end outputs are packed the same way minus the depot entries
+    """
+    num_routes = offsets.shape[0] - 1
+    arrival = np.empty(stops.shape[0] - 2 * num_routes, dtype=np.float64)
+    end = np.empty_like(arrival)
+    wait_time = np.zeros(num_routes, dtype=np.float64)
+    service_time = np.zeros(num_routes, dtype=np.float64)
+    for r in prange(num_routes):
+        route_arrival, route_end, route_wait, route_service = _simulate_route_numba(
+            stops[offsets[r]:offsets[r + 1]], time_matrix, row_of_id, window_start,
+            window_end, service, day_start)
+        first = offsets[r] - 2 * r
+        arrival[first:first + route_arrival.shape[0]] = route_arrival
+        end[first:first + route_end.shape[0]] = route_end
+        wait_time[r] = route_wait
+        service_time[r] = route_service
+    return arrival, end, wait_time, service_time
+
+
+def _simulate_routes_numpy(stops, offsets, time_matrix, windows, day_start):
+    """NumPy fallback for _simulate_routes_numba with the same outputs"""
+    results = [_simulate_route_numpy(stops[offsets[r]:offsets[r + 1]], time_matrix, windows, day_start)
+               for r in range(len(offsets) - 1)]
+    arrival, end, wait_time, service_time = zip(*results)
+    return np.concatenate(arrival), np.concatenate(end), np.array(wait_time), np.array(service_time)
+
+
+def _simulate_route_numpy(stops, time_matrix, windows, day_start):
+    """NumPy fallback for _simulate_route_numba with the same outputs"""
+    # Stops missing from the delivery data just pass through: no window, no service
+    row_of_id, window_start, window_end, service = windows
+    deliveries = stops[1:-1]
+    known = deliveries < len(row_of_id)
+    rows = np.where(known, row_of_id[np.where(known, deliveries, 0)], -1)
+    known = rows >= 0
+    start = np.where(known, window_start[rows], -np.inf)
+    end = np.where(known, window_end[rows], np.inf)
+    service_duration = np.where(known, service[rows], 0.0)
+
+    # Service at stop k begins at max(previous begin + previous service + travel,
+    # window start): with C the running sum of service + travel that is
+    # C_k + max(day start, max_{j<=k}(start_j - C_j)), so no Python loop is needed
+    travel = time_matrix[stops[:-2], deliveries]
+    previous_service = np.concatenate(([0.0], service_duration[:-1]))
+    elapsed = np.cumsum(travel + previous_service)
+    begin = elapsed + np.maximum(day_start, np.maximum.accumulate(start - elapsed))
+    arrival = np.concatenate(([day_start], begin[:-1])) + previous_service + travel
+    return arrival, end, (begin - arrival).sum(), service_duration.sum()
 
 
 class MetricsCalculator:
@@ -18,7 +121,20 @@ class MetricsCalculator:
         self.fuel_cost_per_gallon = DELIVERY.fuel_cost_per_gallon
         self.fuel_efficiency_mpg = DELIVERY.fuel_efficiency_mpg
         self.driver_hourly_cost = 25.0  # $25 per hour for driver
+        # Folded conversion factors (1 km = 0.621371 miles)
+        self._km_to_gallons = 0.621371 / self.fuel_efficiency_mpg
+        self._driver_cost_per_minute = self.driver_hourly_cost / 60
         self.vehicle_fixed_cost_per_day = 150.0  # $150 per day per vehicle
+        # Cost breakdowns keyed by each route's (distance, stop count), the
+        # only route fields they depend on; least recently used evicted first
+        self._cost_cache: Dict[tuple, Dict] = {}
+        self._cost_cache_size = 1024
+        # Baseline pinned by set_baseline, with its cost breakdown
+        self._baseline = None
+        self._baseline_costs = None
+        # Time-window arrays of the last delivery data seen
+        self._windows = None
+        self._windows_source = None
 
     def calculate_route_costs(self, solution: Dict) -> Dict:
         """
@@ -33,22 +149,22 @@ class MetricsCalculator:
         if 'routes' not in solution:
             return {'total_cost': 0, 'fuel_cost': 0, 'driver_cost': 0, 'vehicle_cost': 0}
 
-        total_distance_km = 0
-        total_time_minutes = 0
-        num_vehicles = len(solution['routes'])
+        cache_key = tuple((route.get('total_distance', 0), len(route.get('stops', [])))
+                          for route in solution['routes'])
+        if cache_key in self._cost_cache:
+            costs = self._cost_cache.pop(cache_key)
+            self._cost_cache[cache_key] = costs  # Mark as most recently used
+            return dict(costs)
 
-        for route in solution['routes']:
-            total_distance_km += route.get('total_distance', 0)
-            # Estimate route time based on distance and service times
-            route_time = self._estimate_route_time(route)
-            total_time_minutes += route_time
+        num_vehicles = len(solution['routes'])
+        total_distance_km, total_time_minutes, num_deliveries, _ = self._aggregate_routes(solution['routes'])
 
         # Calculate fuel cost
         fuel_gallons = self._calculate_fuel_consumption(total_distance_km)
         fuel_cost = fuel_gallons * self.fuel_cost_per_gallon
 
         # Calculate driver cost (based on time)
-        driver_cost = (total_time_minutes / 60) * self.driver_hourly_cost
+        driver_cost = total_time_minutes * self._driver_cost_per_minute
 
         # Calculate vehicle cost (fixed cost per vehicle per day)
         vehicle_cost = num_vehicles * self.vehicle_fixed_cost_per_day
@@ -65,38 +181,38 @@ class MetricsCalculator:
             'num_vehicles': num_vehicles,
             'fuel_consumption_gallons': fuel_gallons,
             'cost_per_km': total_cost / total_distance_km if total_distance_km > 0 else 0,
-            'cost_per_delivery': total_cost / sum(len(r.get('stops', [])) - 2 for r in solution['routes']) if solution['routes'] else 0
+            'cost_per_delivery': total_cost / num_deliveries if num_deliveries > 0 else 0
         }
 
-        return costs
+        self._cost_cache[cache_key] = costs
+        while len(self._cost_cache) > self._cost_cache_size:
+            self._cost_cache.pop(next(iter(self._cost_cache)))
 
-    def _estimate_route_time(self, route: Dict) -> float:
-        """Estimate total time for a route in minutes"""
-        # Base travel time (assuming average speed of 45 km/h mixed)
-        distance_km = route.get('total_distance', 0)
-        travel_time_minutes = (distance_km / 45) * 60
+        return dict(costs)
 
-        # Service time for deliveries
-        num_deliveries = len(route.get('stops', [])) - 2  # Exclude depot at start and end
-        service_time_minutes = num_deliveries * 20  # Average 20 minutes per delivery
-
-        total_time = travel_time_minutes + service_time_minutes
-        return total_time
+    def _aggregate_routes(self, routes: List[Dict]) -> Tuple[float, float, int, int]:
+        """Total distance (km), estimated time (minutes), deliveries and demand over routes"""
+        count = len(routes)
+        distances = np.fromiter((route.get('total_distance', 0) for route in routes), dtype=np.float64, count=count)
+        deliveries = np.fromiter((len(route.get('stops', [])) for route in routes), dtype=np.int64, count=count) - 2
+        demands = np.fromiter((route.get('total_demand', 0) for route in routes), dtype=np.int64, count=count)
+        total_time = (distances / AVERAGE_SPEED_KMH * 60 + deliveries * SERVICE_MINUTES_PER_DELIVERY).sum()
+        return float(distances.sum()), float(total_time), int(deliveries.sum()), int(demands.sum())
 
     def _calculate_fuel_consumption(self, distance_km: float) -> float:
         """Calculate fuel consumption in gallons"""
-        # Convert km to miles (1 km = 0.621371 miles)
-        distance_miles = distance_km * 0.621371
-        fuel_gallons = distance_miles / self.fuel_efficiency_mpg
-        return fuel_gallons
+        return distance_km * self._km_to_gallons
 
-    def calculate_efficiency_metrics(self, solution: Dict, delivery_data: pd.DataFrame) -> Dict:
+    def calculate_efficiency_metrics(self, solution: Dict, delivery_data: pd.DataFrame,
+                                     costs: Dict = None) -> Dict:
         """
         Calculate efficiency metrics for a solution
 
         Args:
             solution: Solution dictionary containing routes
             delivery_data: DataFrame with delivery point information
+            costs: Optional calculate_route_costs result for the same solution,
+                reused for the total route time
 
         Returns:
             Efficiency metrics dictionary
@@ -104,10 +220,9 @@ class MetricsCalculator:
         if 'routes' not in solution:
             return {}
 
-        total_distance = sum(route.get('total_distance', 0) for route in solution['routes'])
-        total_demand_served = sum(route.get('total_demand', 0) for route in solution['routes'])
         num_vehicles = len(solution['routes'])
-        num_deliveries = sum(len(route.get('stops', [])) - 2 for route in solution['routes'])
+        total_distance, total_time_minutes, num_deliveries, total_demand_served = (
+            self._aggregate_routes(solution['routes']))
 
         # Calculate capacity utilization
         total_capacity = num_vehicles * DELIVERY.vehicle_capacity
@@ -123,7 +238,7 @@ class MetricsCalculator:
         demand_per_km = total_demand_served / total_distance if total_distance > 0 else 0
 
         # Calculate vehicle productivity (deliveries per hour)
-        total_time_hours = sum(self._estimate_route_time(route) / 60 for route in solution['routes'])
+        total_time_hours = costs['total_time_hours'] if costs is not None else total_time_minutes / 60
         deliveries_per_hour = num_deliveries / total_time_hours if total_time_hours > 0 else 0
 
         efficiency_metrics = {
@@ -141,8 +256,9 @@ class MetricsCalculator:
 
         return efficiency_metrics
 
-    def calculate_time_window_performance(self, solution: Dict, delivery_data: pd.DataFrame,
-                                        time_matrix: np.ndarray) -> Dict:
+    def calculate_time_window_performance(self, solution: Dict, delivery_data: Optional[pd.DataFrame],
+                                        time_matrix: np.ndarray,
+                                        delivery_arrays: Dict[str, np.ndarray] = None) -> Dict:
         """
         Calculate time window performance metrics
 
@@ -150,6 +266,8 @@ class MetricsCalculator:
             solution: Solution dictionary containing routes
             delivery_data: DataFrame with delivery point information
             time_matrix: Travel time matrix between locations
+            delivery_arrays: Optional arrays keyed 'id', 'tw_start_min', 'tw_end_min'
+                and 'service_min' used instead of delivery_data
 
         Returns:
             Time window performance metrics
@@ -157,18 +275,48 @@ class MetricsCalculator:
         if 'routes' not in solution:
             return {}
 
-        # Simulate route execution to check time window compliance
+        # Look up windows and service times by location id once, not per stop
+        if delivery_arrays is not None:
+            windows = _index_windows(delivery_arrays['id'], delivery_arrays['tw_start_min'],
+                                     delivery_arrays['tw_end_min'], delivery_arrays['service_min'])
+        else:
+            windows = self._index_time_windows(delivery_data)
+        time_matrix = np.ascontiguousarray(time_matrix, dtype=np.float64)
+
+        # Simulate every route with deliveries in one call, packed as flat stops + offsets
+        routes = [route.get('stops', []) for route in solution['routes']]
+        total_deliveries = sum(len(stops) - 2 for stops in routes)  # Exclude depot at start and end
+        routes = [stops for stops in routes if len(stops) >= 3]  # No actual deliveries otherwise
+
         time_window_violations = []
         total_wait_time = 0
         total_service_time = 0
-
-        for route in solution['routes']:
-            route_analysis = self._analyze_route_time_windows(route, delivery_data, time_matrix)
-            time_window_violations.extend(route_analysis['violations'])
-            total_wait_time += route_analysis['wait_time']
-            total_service_time += route_analysis['service_time']
-
-        total_deliveries = sum(len(route.get('stops', [])) - 2 for route in solution['routes'])
+        if routes:
+            stops = np.concatenate(routes).astype(np.int64)
+            offsets = np.zeros(len(routes) + 1, dtype=np.int64)
+            np.cumsum([len(route_stops) for route_stops in routes], out=offsets[1:])
+
+            day_start = 8 * 60  # Start at 8:00 AM in minutes
+            if NUMBA_AVAILABLE:
+                arrival, end, wait_time, service_time = _simulate_routes_numba(
+                    stops, offsets, time_matrix, *windows, day_start)
+            else:
+                arrival, end, wait_time, service_time = _simulate_routes_numpy(
+                    stops, offsets, time_matrix, windows, day_start)
+
+            is_delivery = np.ones(len(stops), dtype=bool)
+            is_delivery[offsets[:-1]] = False
+            is_delivery[offsets[1:] - 1] = False
+            deliveries = stops[is_delivery]
+
+            time_window_violations = [{
+                'location_id': int(deliveries[k]),
+                'arrival_time': float(arrival[k]),
+                'time_window_end': int(end[k]),
+                'late_by_minutes': float(arrival[k] - end[k])
+            } for k in np.flatnonzero(arrival > end)]
+            total_wait_time = float(wait_time.sum())
+            total_service_time = float(service_time.sum())
 
         performance = {
             'time_window_violations': len(time_window_violations),
@@ -181,66 +329,28 @@ class MetricsCalculator:
 
         return performance
 
-    def _analyze_route_time_windows(self, route: Dict, delivery_data: pd.DataFrame,
-                                  time_matrix: np.ndarray) -> Dict:
-        """Analyze time window compliance for a single route"""
-        violations = []
-        wait_time = 0
-        service_time = 0
-
-        if len(route.get('stops', [])) < 3:  # No actual deliveries
-            return {'violations': violations, 'wait_time': wait_time, 'service_time': service_time}
-
-        current_time = 8 * 60  # Start at 8:00 AM in minutes
-
-        for i in range(1, len(route['stops']) - 1):  # Skip depot at start and end
-            location_id = route['stops'][i]
-
-            # Get travel time from previous location
-            prev_location = route['stops'][i-1]
-            travel_time = time_matrix[prev_location][location_id]
-
-            # Update current time (travel + previous service)
-            current_time += travel_time
-
-            # Get delivery information
-            delivery_info = delivery_data[delivery_data['id'] == location_id]
-            if delivery_info.empty:
-                continue
-
-            # Get time window
-            time_start = self._time_string_to_minutes(delivery_info['time_window_start'].iloc[0])
-            time_end = self._time_string_to_minutes(delivery_info['time_window_end'].iloc[0])
-            service_duration = delivery_info['service_time_minutes'].iloc[0]
-
-            # Check if arrival is within time window
-            if current_time < time_start:
-                # Arrived early, need to wait
-                wait_time += (time_start - current_time)
-                current_time = time_start
-            elif current_time > time_end:
-                # Arrived late - this is a violation
-                violations.append({
-                    'location_id': location_id,
-                    'arrival_time': current_time,
-                    'time_window_end': time_end,
-                    'late_by_minutes': current_time - time_end
-                })
-
-            # Add service time
-            current_time += service_duration
-            service_time += service_duration
-
-        return {
-            'violations': violations,
-            'wait_time': wait_time,
-            'service_time': service_time
-        }
-
-    def _time_string_to_minutes(self, time_str: str) -> int:
-        """Convert time string to minutes since midnight"""
-        hour, minute = map(int, time_str.split(':'))
-        return hour * 60 + minute
+    def _index_time_windows(self, delivery_data: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """Time-window arrays for delivery_data, reused while the same DataFrame is passed"""
+        if self._windows_source is delivery_data:
+            return self._windows
+
+        self._windows = _index_windows(
+            delivery_data['id'].to_numpy(),
+            hhmm_to_minutes(delivery_data['time_window_start']),
+            hhmm_to_minutes(delivery_data['time_window_end']),
+            delivery_data['service_time_minutes'].to_numpy())
+        self._windows_source = delivery_data
+        return self._windows
+
+    def set_baseline(self, baseline: Dict) -> None:
+        """Pin a baseline so repeated comparisons against it reuse one cost breakdown"""
+        self._baseline = baseline
+        self._baseline_costs = self.calculate_route_costs(baseline)
+
+    def clear_baseline(self) -> None:
+        """Forget the baseline pinned by set_baseline"""
+        self._baseline = None
+        self._baseline_costs = None
 
     def compare_solutions(self, baseline: Dict, optimized: Dict) -> Dict:
         """
@@ -253,7 +363,10 @@ class MetricsCalculator:
         Returns:
             Comparison metrics
         """
-        baseline_costs = self.calculate_route_costs(baseline)
+        if baseline is not None and baseline is self._baseline:
+            baseline_costs = dict(self._baseline_costs)
+        else:
+            baseline_costs = self.calculate_route_costs(baseline)
         optimized_costs = self.calculate_route_costs(optimized)
 
         # Calculate improvements
@@ -299,7 +412,7 @@ class MetricsCalculator:
             KPI summary dictionary
         """
         costs = self.calculate_route_costs(solution)
-        efficiency = self.calculate_efficiency_metrics(solution, delivery_data)
+        efficiency = self.calculate_efficiency_metrics(solution, delivery_data, costs)
 
         kpis = {
             'cost_metrics': {
@@ -325,7 +438,7 @@ class MetricsCalculator:
             },
             'environmental_metrics': {
                 'fuel_consumption_gallons': costs['fuel_consumption_gallons'],
-                'co2_emissions_lb': costs['fuel_consumption_gallons'] * 19.6,  # ~19.6 lb CO2 per gallon gasoline
+                'co2_emissions_lb': costs['fuel_consumption_gallons'] * CO2_LB_PER_GALLON,
                 'distance_reduction_vs_baseline': 0,
                 'fuel_reduction_vs_baseline': 0
             }
@@ -348,6 +461,46 @@ class MetricsCalculator:
 
         return kpis
 
+    def generate_kpi_summary_batch(self, solutions: List[Dict],
+                                   delivery_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Generate headline KPIs for many solutions at once, e.g. a population during tuning
+
+        Args:
+            solutions: Solutions to analyze
+            delivery_data: Delivery data DataFrame
+
+        Returns:
+            Dictionary of per-solution metric arrays, in the order of solutions
+        """
+        totals = np.array([self._aggregate_routes(solution.get('routes', [])) for solution in solutions],
+                          dtype=np.float64).reshape(-1, 4)
+        distance_km, time_minutes, deliveries, demand = totals.T
+        num_vehicles = np.fromiter((len(solution.get('routes', [])) for solution in solutions),
+                                   dtype=np.int64, count=len(solutions))
+
+        fuel_gallons = distance_km * self._km_to_gallons
+        fuel_cost = fuel_gallons * self.fuel_cost_per_gallon
+        driver_cost = time_minutes * self._driver_cost_per_minute
+        vehicle_cost = num_vehicles * self.vehicle_fixed_cost_per_day
+        total_capacity = num_vehicles * DELIVERY.vehicle_capacity
+
+        return {
+            'total_cost': fuel_cost + driver_cost + vehicle_cost,
+            'fuel_cost': fuel_cost,
+            'driver_cost': driver_cost,
+            'vehicle_cost': vehicle_cost,
+            'total_distance_km': distance_km,
+            'total_time_hours': time_minutes / 60,
+            'num_vehicles': num_vehicles,
+            'total_deliveries': deliveries.astype(np.int64),
+            'total_demand_served': demand.astype(np.int64),
+            'capacity_utilization_percent': np.divide(demand * 100, total_capacity,
+                                                      out=np.zeros_like(demand), where=total_capacity > 0),
+            'fuel_consumption_gallons': fuel_gallons,
+            'co2_emissions_lb': fuel_gallons * CO2_LB_PER_GALLON
+        }
+
 
 def main():
     """Test function for metrics calculation"""
@@ -0,0 +1,41 @@
+"""
+JSON serialization helpers
+Uses orjson when it is installed and falls back to the standard json module
+"""
+
+import json
+import numpy as np
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def numpy_default(obj: Any) -> Any:
+    """JSON fallback for NumPy scalars/arrays and datetimes; anything else is stringified"""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(filepath: str, data: Any, default: Optional[Callable] = None) -> None:
+    """Write data to filepath as indented JSON; NumPy values are handled natively by orjson"""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=default, option=options))
+    else:
+        # Encode in memory and write once rather than streaming many small chunks
+        encoded = json.dumps(data, indent=2, default=default)
+        with open(filepath, 'w', buffering=1 << 20) as f:
+            f.write(encoded)
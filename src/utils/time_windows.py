@@ -0,0 +1,20 @@
+"""
+Time-window parsing helpers
+Converts "H:MM" / "HH:MM" clock strings to minutes since midnight
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def hhmm_to_minutes(times: pd.Series) -> np.ndarray:
+    """Convert a column of "H:MM" or "HH:MM" strings to minutes since midnight"""
+    # Categorical windows take a few distinct values: parse those, then gather
+    if isinstance(times.dtype, pd.CategoricalDtype):
+        category_minutes = hhmm_to_minutes(pd.Series(times.cat.categories))
+        return category_minutes[times.cat.codes.to_numpy()]
+
+    parts = times.astype(str).str.split(':', n=1, expand=True)
+    hours = parts[0].astype(np.int32).to_numpy()
+    minutes = parts[1].astype(np.int32).to_numpy()
+    return hours * 60 + minutes
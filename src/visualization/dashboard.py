@@ -6,9 +6,6 @@ Interactive web interface for visualization and analysis
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import time
 from datetime import datetime
 import json
@@ -19,20 +16,274 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from optimization.route_optimizer import RouteOptimizer
-from visualization.map_generator import MapGenerator
-from utils.metrics import MetricsCalculator
-from utils.config import VISUALIZATION, DATA_GENERATION, DELIVERY
+from utils.metrics import CO2_LB_PER_GALLON
+from utils.config import VISUALIZATION, DATA_GENERATION, DELIVERY, OPTIMIZATION
+
+
+_WELCOME_MARKDOWN = """
+## 🎯 Welcome to LPG Delivery Route Optimization!
+
+This intelligent system optimizes delivery routes for LPG (Liquefied Petroleum Gas) trucks,
+helping to reduce fuel consumption, save time, and improve delivery efficiency.
+
+### 🚀 Key Features:
+- **🗺️ Interactive Maps**: Visualize routes before and after optimization
+- **📊 Performance Metrics**: Track distance, time, and cost improvements
+- **⚙️ Customizable Parameters**: Adjust vehicles, time windows, and constraints
+- **📍 Mixed Areas**: Handle both urban and rural delivery scenarios
+
+### 🎮 How to Use:
+1. **Generate Scenario**: Use the sidebar controls to create a delivery scenario
+2. **Run Optimization**: Click "Run Optimization" to find optimal routes
+3. **Analyze Results**: Explore maps and metrics to see improvements
+
+### 📈 Expected Improvements:
+- **Distance Reduction**: 20-40% fewer kilometers traveled
+- **Cost Savings**: 15-30% reduction in total delivery costs
+- **Time Efficiency**: 25-35% improvement in delivery time
+- **Fuel Conservation**: 20-35% reduction in fuel consumption
+
+---
+**👈 Get started by generating a scenario or loading sample data from the sidebar!**
+"""
+
+
+# Figure builders take plain values so st.cache_data can key on them and
+# reruns that don't change the inputs reuse the built figure. Plotly is
+# imported inside them so pages without charts never load it
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_comparison_bars(baseline_distance: float, optimized_distance: float,
+                           baseline_cost: float, optimized_cost: float) -> "go.Figure":
+    """Grouped baseline vs optimized bars for total distance and total cost"""
+    import plotly.graph_objects as go
+
+    categories = ['🛣️ Distance (km)', '💰 Cost ($)']
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Baseline',
+        x=categories,
+        y=[baseline_distance, baseline_cost],
+        marker_color='red'
+    ))
+    fig.add_trace(go.Bar(
+        name='Optimized',
+        x=categories,
+        y=[optimized_distance, optimized_cost],
+        marker_color='green'
+    ))
+    fig.update_layout(
+        title='Baseline vs Optimized',
+        barmode='group',
+        height=400
+    )
+    return fig
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_improvement_pie(labels: tuple, percent: float, title: str) -> "go.Figure":
+    """Donut chart splitting 100% into the improvement and the remainder"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=list(labels),
+        values=[percent, 100 - percent],
+        hole=0.3,
+        marker_colors=['green', 'lightgray']
+    )])
+    fig.update_layout(
+        title=title,
+        height=300
+    )
+    return fig
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_counts_pie(names: tuple, values: tuple, title: str) -> "go.Figure":
+    """Pie chart of category counts"""
+    import plotly.express as px
+
+    return px.pie(values=list(values), names=list(names), title=title)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_demand_histogram(counts: tuple, edges: tuple) -> "go.Figure":
+    """Histogram of cylinder demand per delivery from bin counts computed server-side"""
+    import plotly.graph_objects as go
+
+    edges = np.asarray(edges)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=list(counts),
+        width=np.diff(edges)
+    ))
+    fig.update_layout(
+        title="LPG Cylinder Demand Distribution",
+        xaxis_title='Number of Cylinders',
+        yaxis_title='Number of Deliveries'
+    )
+    return fig
+
+
+@st.cache_data(persist='disk', show_spinner=False)
+def _optimize_seeded_scenario(seed: int, num_deliveries: int, num_vehicles: int,
+                              time_limit_seconds: int, include_time_windows: bool,
+                              urban_percentage: float) -> tuple:
+    """
+    Generate and optimize a seeded scenario, returning (delivery_data, results).
+    The scenario is fully determined by the arguments, so results persist on
+    disk and reloads or dashboard restarts skip the solver
+    """
+    optimizer = RouteOptimizer(seed=seed)
+    results = optimizer.optimize_single_scenario(
+        num_deliveries=num_deliveries,
+        num_vehicles=num_vehicles,
+        time_limit_seconds=time_limit_seconds,
+        include_time_windows=include_time_windows
+    )
+    return optimizer.delivery_data, results
+
+
+def _data_hash(delivery_data: pd.DataFrame) -> int:
+    """Content hash of the delivery data for cache keys"""
+    return int(pd.util.hash_pandas_object(delivery_data, index=False).sum())
+
+
+# Label columns are small fixed vocabularies, so the dashboard keeps them as
+# categoricals: counts and filter masks then work on integer codes
+_AREA_TYPES = pd.CategoricalDtype(['depot', 'urban', 'rural'])
+_PRIORITIES = pd.CategoricalDtype(['depot', 'normal', 'high', 'emergency'])
+
+
+def _with_categorical_labels(delivery_data: pd.DataFrame) -> pd.DataFrame:
+    """Copy of the delivery data with area type and priority as categoricals"""
+    return delivery_data.astype({'area_type': _AREA_TYPES, 'priority': _PRIORITIES})
+
+
+def _category_counts(labels: pd.Series) -> tuple:
+    """(names, int32 counts) of the categories that occur in labels"""
+    counts = labels.value_counts()
+    counts = counts[counts.to_numpy() > 0]
+    return tuple(counts.index.astype(str)), tuple(counts.to_numpy(dtype=np.int32).tolist())
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _delivery_summary(data_hash: int, _delivery_data: pd.DataFrame) -> dict:
+    """
+    Depot-free totals, area and priority counts and demand histogram bins,
+    computed once per delivery data and shared by the points and analytics tabs
+    """
+    delivery_only = _delivery_data[_delivery_data['id'].to_numpy() != 0]
+    # Bin on the server so the figure carries 20 bars, not one value per delivery
+    counts, edges = np.histogram(delivery_only['demand'].to_numpy(), bins=20)
+    return {
+        'num_deliveries': len(delivery_only),
+        'total_demand': int(delivery_only['demand'].sum()),
+        'area_counts': _category_counts(delivery_only['area_type']),
+        'priority_counts': _category_counts(delivery_only['priority']),
+        'demand_histogram': (tuple(counts.tolist()), tuple(edges.tolist()))
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_route_summary(route_totals: tuple) -> pd.DataFrame:
+    """Route summary table from (distance, demand, stop count) per route, built column by column"""
+    num_routes = len(route_totals)
+    totals = np.array(route_totals, dtype=float).reshape(num_routes, 3)
+    distances = totals[:, 0]
+    num_deliveries = totals[:, 2].astype(np.int64) - 2  # Exclude depot
+    # Numeric columns stay numeric (NaN when a route has no deliveries);
+    # formatting is left to the table's column config
+    km_per_delivery = np.divide(distances, num_deliveries, out=np.full(num_routes, np.nan),
+                                where=num_deliveries > 0)
+    return pd.DataFrame({
+        'Route #': np.arange(1, num_routes + 1),
+        'Deliveries': num_deliveries,
+        'Distance (km)': distances,
+        'Demand (cylinders)': totals[:, 1].astype(np.int64),
+        'Efficiency (km/delivery)': km_per_delivery
+    })
+
+
+def _build_stop_details(delivery_data: pd.DataFrame, stops: list) -> pd.DataFrame:
+    """
+    Stop-by-stop table for one route from a single merge against the delivery
+    data; stops missing from the data are dropped, the depot gets fixed labels
+    """
+    route_stops = pd.DataFrame({'id': np.asarray(stops, dtype=np.int64)}).merge(
+        delivery_data, on='id', how='left')
+    is_depot = route_stops['id'].to_numpy() == 0
+    route_stops = route_stops[is_depot | route_stops['address'].notna().to_numpy()]
+    is_depot = route_stops['id'].to_numpy() == 0
+
+    stop_type = (route_stops['area_type'].astype(str).str.title() + ' - ' +
+                 route_stops['priority'].astype(str).str.title())
+    time_window = (route_stops['time_window_start'].astype(str) + ' - ' +
+                   route_stops['time_window_end'].astype(str))
+    # Unmatched stops make the merge upcast ints to floats; print them as ints again
+    service_time = route_stops['service_time_minutes'].astype(str).str.removesuffix('.0') + ' min'
+    return pd.DataFrame({
+        'Stop #': np.arange(1, len(route_stops) + 1),
+        'Location ID': route_stops['id'].to_numpy(),
+        'Type': np.where(is_depot, 'Depot', stop_type),
+        'Demand': np.where(is_depot, 0, route_stops['demand'].fillna(0)).astype(np.int64),
+        'Address': np.where(is_depot, 'LPG Depot - Central Distribution', route_stops['address']),
+        'Time Window': np.where(is_depot, None, time_window),
+        'Service Time': np.where(is_depot, None, service_time)
+    })
+
+
+def _routes_key(routes: list) -> tuple:
+    """Hashable summary of a route list for cache keys"""
+    return tuple((route.get('total_distance', 0), tuple(route.get('stops', []))) for route in routes)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_map_html(data_hash: int, routes_key: tuple, view_mode: str,
+                    _map_generator, _delivery_data, _baseline_routes, _optimized_routes) -> str:
+    """
+    Rendered Folium HTML for a route map view. Only the data hash, routes key
+    and view mode key the cache; the underscored arguments are not hashed
+    """
+    if view_mode == "Before & After Comparison":
+        route_map = _map_generator.create_before_after_map(
+            delivery_data=_delivery_data,
+            baseline_routes=_baseline_routes,
+            optimized_routes=_optimized_routes
+        )
+    elif view_mode == "Optimized Routes Only":
+        route_map = _map_generator.create_route_analysis_map(
+            delivery_data=_delivery_data,
+            routes=_optimized_routes,
+            route_type='optimized'
+        )
+    else:  # Baseline Routes Only
+        route_map = _map_generator.create_route_analysis_map(
+            delivery_data=_delivery_data,
+            routes=_baseline_routes,
+            route_type='baseline'
+        )
+    return route_map._repr_html_()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_map_generator():
+    """MapGenerator shared across reruns and sessions; it keeps no per-session state"""
+    from visualization.map_generator import MapGenerator
+    return MapGenerator()
 
 
 class Dashboard:
     """Main Streamlit dashboard for route optimization"""
 
     def __init__(self):
-        self.optimizer = RouteOptimizer()
-        self.map_generator = MapGenerator()
-        self.metrics_calculator = MetricsCalculator()
+        self.map_generator = None  # Created on first use by the route maps tab
 
         # Session state initialization
+        # The optimizer holds scenario state, so it is kept per session, not shared
+        if 'optimizer' not in st.session_state:
+            st.session_state.optimizer = RouteOptimizer()
+        self.optimizer = st.session_state.optimizer
         if 'optimization_results' not in st.session_state:
             st.session_state.optimization_results = None
         if 'delivery_data' not in st.session_state:
@@ -168,32 +419,7 @@ class Dashboard:
 
     def _render_welcome_page(self):
         """Render welcome page when no data is loaded"""
-        st.markdown("""
-        ## 🎯 Welcome to LPG Delivery Route Optimization!
-
-        This intelligent system optimizes delivery routes for LPG (Liquefied Petroleum Gas) trucks,
-        helping to reduce fuel consumption, save time, and improve delivery efficiency.
-
-        ### 🚀 Key Features:
-        - **🗺️ Interactive Maps**: Visualize routes before and after optimization
-        - **📊 Performance Metrics**: Track distance, time, and cost improvements
-        - **⚙️ Customizable Parameters**: Adjust vehicles, time windows, and constraints
-        - **📍 Mixed Areas**: Handle both urban and rural delivery scenarios
-
-        ### 🎮 How to Use:
-        1. **Generate Scenario**: Use the sidebar controls to create a delivery scenario
-        2. **Run Optimization**: Click "Run Optimization" to find optimal routes
-        3. **Analyze Results**: Explore maps and metrics to see improvements
-
-        ### 📈 Expected Improvements:
-        - **Distance Reduction**: 20-40% fewer kilometers traveled
-        - **Cost Savings**: 15-30% reduction in total delivery costs
-        - **Time Efficiency**: 25-35% improvement in delivery time
-        - **Fuel Conservation**: 20-35% reduction in fuel consumption
-
-        ---
-        **👈 Get started by generating a scenario or loading sample data from the sidebar!**
-        """)
+        st.markdown(_WELCOME_MARKDOWN)
 
         # Add sample metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -279,16 +505,19 @@ class Dashboard:
 
         st.markdown("---")
 
+    @st.fragment
     def _render_route_maps(self):
         """Render before/after route comparison maps"""
         st.subheader("🗺️ Route Comparison Maps")
 
-        if not st.session_state.delivery_data or not st.session_state.optimization_results:
+        if st.session_state.delivery_data is None or not st.session_state.optimization_results:
             st.warning("No optimization results available. Please run optimization first.")
             return
 
         delivery_data = st.session_state.delivery_data
         results = st.session_state.optimization_results
+        baseline_routes = results.get('baseline_solution', {}).get('routes', [])
+        optimized_routes = results.get('optimized_solution', {}).get('routes', [])
 
         # Create map view selector
         view_mode = st.radio(
@@ -299,31 +528,23 @@ class Dashboard:
 
         if view_mode == "Before & After Comparison":
             st.subheader("🔄 Before (Red) vs After (Green) Routes")
-            comparison_map = self.map_generator.create_before_after_map(
-                delivery_data=delivery_data,
-                baseline_routes=results.get('baseline_solution', {}).get('routes', []),
-                optimized_routes=results.get('optimized_solution', {}).get('routes', [])
-            )
-            st.components.v1.html(comparison_map._repr_html_(), height=600)
-
         elif view_mode == "Optimized Routes Only":
             st.subheader("✅ Optimized Routes")
-            optimized_map = self.map_generator.create_route_analysis_map(
-                delivery_data=delivery_data,
-                routes=results.get('optimized_solution', {}).get('routes', []),
-                route_type='optimized'
-            )
-            st.components.v1.html(optimized_map._repr_html_(), height=600)
-
         else:  # Baseline Routes Only
             st.subheader("📍 Baseline Routes")
-            baseline_map = self.map_generator.create_route_analysis_map(
-                delivery_data=delivery_data,
-                routes=results.get('baseline_solution', {}).get('routes', []),
-                route_type='baseline'
-            )
-            st.components.v1.html(baseline_map._repr_html_(), height=600)
 
+        if self.map_generator is None:
+            self.map_generator = _get_map_generator()
+
+        map_html = _build_map_html(
+            _data_hash(delivery_data),
+            (_routes_key(baseline_routes), _routes_key(optimized_routes)),
+            view_mode,
+            self.map_generator, delivery_data, baseline_routes, optimized_routes
+        )
+        st.components.v1.html(map_html, height=600)
+
+    @st.fragment
     def _render_performance_metrics(self, improvement_metrics):
         """Render performance metrics charts"""
         st.subheader("📊 Performance Metrics")
@@ -332,94 +553,38 @@ class Dashboard:
             st.warning("No improvement metrics available.")
             return
 
-        # Create comparison charts
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Distance comparison
-            baseline_dist = improvement_metrics.get('baseline', {}).get('total_distance_km', 0)
-            optimized_dist = improvement_metrics.get('optimized', {}).get('total_distance_km', 0)
-
-            fig_distance = go.Figure()
-            fig_distance.add_trace(go.Bar(
-                name='Baseline',
-                x=['Total Distance'],
-                y=[baseline_dist],
-                marker_color='red'
-            ))
-            fig_distance.add_trace(go.Bar(
-                name='Optimized',
-                x=['Total Distance'],
-                y=[optimized_dist],
-                marker_color='green'
-            ))
-            fig_distance.update_layout(
-                title='🛣️ Distance Comparison (km)',
-                yaxis_title='Distance (km)',
-                height=400
-            )
-            st.plotly_chart(fig_distance, use_container_width=True)
-
-        with col2:
-            # Cost comparison
-            baseline_cost = improvement_metrics.get('baseline', {}).get('total_cost', 0)
-            optimized_cost = improvement_metrics.get('optimized', {}).get('total_cost', 0)
-
-            fig_cost = go.Figure()
-            fig_cost.add_trace(go.Bar(
-                name='Baseline',
-                x=['Total Cost'],
-                y=[baseline_cost],
-                marker_color='red'
-            ))
-            fig_cost.add_trace(go.Bar(
-                name='Optimized',
-                x=['Total Cost'],
-                y=[optimized_cost],
-                marker_color='green'
-            ))
-            fig_cost.update_layout(
-                title='💰 Cost Comparison ($)',
-                yaxis_title='Cost ($)',
-                height=400
-            )
-            st.plotly_chart(fig_cost, use_container_width=True)
+        # Distance and cost comparison in one grouped bar chart
+        baseline = improvement_metrics.get('baseline', {})
+        optimized = improvement_metrics.get('optimized', {})
+        fig_comparison = _build_comparison_bars(
+            baseline.get('total_distance_km', 0), optimized.get('total_distance_km', 0),
+            baseline.get('total_cost', 0), optimized.get('total_cost', 0)
+        )
+        st.plotly_chart(fig_comparison, use_container_width=True)
 
         # Improvement percentages
         col3, col4, col5 = st.columns(3)
 
         with col3:
             distance_improvement = improvement_metrics.get('distance_reduction_percent', 0)
-            fig_dist_pie = go.Figure(data=[go.Pie(
-                labels=['Reduced', 'Remaining'],
-                values=[distance_improvement, 100 - distance_improvement],
-                hole=0.3,
-                marker_colors=['green', 'lightgray']
-            )])
-            fig_dist_pie.update_layout(
-                title=f'Distance Reduction: {distance_improvement:.1f}%',
-                height=300
+            fig_dist_pie = _build_improvement_pie(
+                ('Reduced', 'Remaining'), distance_improvement,
+                f'Distance Reduction: {distance_improvement:.1f}%'
             )
             st.plotly_chart(fig_dist_pie, use_container_width=True)
 
         with col4:
             cost_improvement = improvement_metrics.get('cost_savings_percent', 0)
-            fig_cost_pie = go.Figure(data=[go.Pie(
-                labels=['Saved', 'Remaining'],
-                values=[cost_improvement, 100 - cost_improvement],
-                hole=0.3,
-                marker_colors=['green', 'lightgray']
-            )])
-            fig_cost_pie.update_layout(
-                title=f'Cost Savings: {cost_improvement:.1f}%',
-                height=300
+            fig_cost_pie = _build_improvement_pie(
+                ('Saved', 'Remaining'), cost_improvement,
+                f'Cost Savings: {cost_improvement:.1f}%'
             )
             st.plotly_chart(fig_cost_pie, use_container_width=True)
 
         with col5:
             # Environmental impact
             fuel_reduction = improvement_metrics.get('optimized', {}).get('total_distance_km', 0) * 0.1  # Estimate
-            co2_reduction = fuel_reduction * 19.6  # lbs CO2 per gallon
+            co2_reduction = fuel_reduction * CO2_LB_PER_GALLON
 
             st.metric(
                 label="🌱 CO₂ Reduction",
@@ -432,6 +597,7 @@ class Dashboard:
                 delta="Cost & environmental benefit"
             )
 
+    @st.fragment
     def _render_route_details(self, optimized_solution):
         """Render detailed route information"""
         st.subheader("📋 Route Details")
@@ -447,19 +613,19 @@ class Dashboard:
             return
 
         # Create route summary table
-        route_data = []
-        for i, route in enumerate(routes):
-            num_deliveries = len(route.get('stops', [])) - 2  # Exclude depot
-            route_data.append({
-                'Route #': i + 1,
-                'Deliveries': num_deliveries,
-                'Distance (km)': f"{route.get('total_distance', 0):.2f}",
-                'Demand (cylinders)': route.get('total_demand', 0),
-                'Efficiency (km/delivery)': f"{route.get('total_distance', 0) / num_deliveries:.2f}" if num_deliveries > 0 else "N/A"
-            })
-
-        route_df = pd.DataFrame(route_data)
-        st.dataframe(route_df, use_container_width=True)
+        route_df = _build_route_summary(tuple(
+            (route.get('total_distance', 0), route.get('total_demand', 0), len(route.get('stops', [])))
+            for route in routes
+        ))
+        st.dataframe(
+            route_df,
+            column_config={
+                'Distance (km)': st.column_config.NumberColumn(format='%.2f'),
+                'Efficiency (km/delivery)': st.column_config.NumberColumn(format='%.2f')
+            },
+            hide_index=True,
+            use_container_width=True
+        )
 
         # Detailed route stops
         st.subheader("🔍 Detailed Route Stops")
@@ -476,36 +642,10 @@ class Dashboard:
             stops = route.get('stops', [])
 
             if st.session_state.delivery_data is not None:
-                # Get detailed stop information
-                stop_details = []
-                for stop_id in stops:
-                    if stop_id == 0:
-                        stop_details.append({
-                            'Stop #': len(stop_details) + 1,
-                            'Location ID': stop_id,
-                            'Type': 'Depot',
-                            'Demand': 0,
-                            'Address': 'LPG Depot - Central Distribution'
-                        })
-                    else:
-                        delivery_info = st.session_state.delivery_data[
-                            st.session_state.delivery_data['id'] == stop_id
-                        ]
-                        if not delivery_info.empty:
-                            row = delivery_info.iloc[0]
-                            stop_details.append({
-                                'Stop #': len(stop_details) + 1,
-                                'Location ID': stop_id,
-                                'Type': f"{row['area_type'].title()} - {row['priority'].title()}",
-                                'Demand': row['demand'],
-                                'Address': row['address'],
-                                'Time Window': f"{row['time_window_start']} - {row['time_window_end']}",
-                                'Service Time': f"{row['service_time_minutes']} min"
-                            })
-
-                stop_df = pd.DataFrame(stop_details)
+                stop_df = _build_stop_details(st.session_state.delivery_data, stops)
                 st.dataframe(stop_df, use_container_width=True)
 
+    @st.fragment
     def _render_delivery_points(self):
         """Render delivery points information"""
         st.subheader("📍 Delivery Points Information")
@@ -514,24 +654,23 @@ class Dashboard:
             st.warning("No delivery data available.")
             return
 
-        delivery_data = st.session_state.delivery_data.copy()
+        delivery_data = st.session_state.delivery_data
 
         # Exclude depot for statistics
-        delivery_only = delivery_data[delivery_data['id'] != 0]
+        summary = _delivery_summary(_data_hash(delivery_data), delivery_data)
+        area_counts = dict(zip(*summary['area_counts']))
 
         # Summary statistics
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("Total Deliveries", len(delivery_only))
+            st.metric("Total Deliveries", summary['num_deliveries'])
         with col2:
-            st.metric("Total Demand", f"{delivery_only['demand'].sum()} cylinders")
+            st.metric("Total Demand", f"{summary['total_demand']} cylinders")
         with col3:
-            urban_count = (delivery_only['area_type'] == 'urban').sum()
-            st.metric("Urban Deliveries", urban_count)
+            st.metric("Urban Deliveries", area_counts.get('urban', 0))
         with col4:
-            rural_count = (delivery_only['area_type'] == 'rural').sum()
-            st.metric("Rural Deliveries", rural_count)
+            st.metric("Rural Deliveries", area_counts.get('rural', 0))
 
         # Filter and search
         col1, col2 = st.columns(2)
@@ -550,20 +689,21 @@ class Dashboard:
                 index=0
             )
 
-        # Apply filters
-        filtered_data = delivery_only.copy()
+        # Apply filters as one combined mask and a single gather
+        mask = delivery_data['id'].to_numpy() != 0
         if area_filter != "All":
-            filtered_data = filtered_data[filtered_data['area_type'] == area_filter.lower()]
+            mask = mask & (delivery_data['area_type'] == area_filter.lower()).to_numpy()
         if priority_filter != "All":
-            filtered_data = filtered_data[filtered_data['priority'] == priority_filter.lower()]
+            mask = mask & (delivery_data['priority'] == priority_filter.lower()).to_numpy()
 
         # Display filtered data
         st.dataframe(
-            filtered_data[['id', 'area_type', 'priority', 'demand', 'time_window_start',
-                          'time_window_end', 'address']],
+            delivery_data.loc[mask, ['id', 'area_type', 'priority', 'demand', 'time_window_start',
+                                     'time_window_end', 'address']],
             use_container_width=True
         )
 
+    @st.fragment
     def _render_analytics(self):
         """Render advanced analytics and insights"""
         st.subheader("📈 Advanced Analytics")
@@ -602,40 +742,23 @@ class Dashboard:
         if st.session_state.delivery_data is not None:
             st.subheader("📊 Delivery Distribution Analysis")
 
-            delivery_only = st.session_state.delivery_data[
-                st.session_state.delivery_data['id'] != 0
-            ]
+            delivery_data = st.session_state.delivery_data
+            summary = _delivery_summary(_data_hash(delivery_data), delivery_data)
 
             # Area type distribution
             col1, col2 = st.columns(2)
 
             with col1:
-                area_counts = delivery_only['area_type'].value_counts()
-                fig_area = px.pie(
-                    values=area_counts.values,
-                    names=area_counts.index,
-                    title="Area Type Distribution"
-                )
+                fig_area = _build_counts_pie(*summary['area_counts'], "Area Type Distribution")
                 st.plotly_chart(fig_area, use_container_width=True)
 
             with col2:
-                priority_counts = delivery_only['priority'].value_counts()
-                fig_priority = px.pie(
-                    values=priority_counts.values,
-                    names=priority_counts.index,
-                    title="Priority Distribution"
-                )
+                fig_priority = _build_counts_pie(*summary['priority_counts'], "Priority Distribution")
                 st.plotly_chart(fig_priority, use_container_width=True)
 
             # Demand distribution
             st.subheader("📦 Demand Distribution")
-            fig_demand = px.histogram(
-                delivery_only,
-                x='demand',
-                nbins=20,
-                title="LPG Cylinder Demand Distribution",
-                labels={'demand': 'Number of Cylinders', 'count': 'Number of Deliveries'}
-            )
+            fig_demand = _build_demand_histogram(*summary['demand_histogram'])
             st.plotly_chart(fig_demand, use_container_width=True)
 
     def _generate_new_scenario(self, num_deliveries, urban_percentage):
@@ -652,14 +775,13 @@ class Dashboard:
                 )
 
                 # Store in session state
-                st.session_state.delivery_data = delivery_data
+                st.session_state.delivery_data = _with_categorical_labels(delivery_data)
                 st.session_state.current_scenario = scenario_summary
 
                 # Clear previous optimization results
                 st.session_state.optimization_results = None
 
                 st.success(f"✅ Generated scenario with {num_deliveries} deliveries!")
-                st.rerun()
 
             except Exception as e:
                 st.error(f"❌ Error generating scenario: {str(e)}")
@@ -672,19 +794,28 @@ class Dashboard:
 
         with st.spinner("🚀 Running route optimization... This may take a few seconds..."):
             try:
-                # Run optimization
-                results = self.optimizer.optimize_single_scenario(
-                    num_deliveries=len(st.session_state.delivery_data) - 1,
-                    num_vehicles=num_vehicles,
-                    time_limit_seconds=time_limit,
-                    include_time_windows=include_time_windows
-                )
-
-                # Store results
+                # Run optimization; seeded scenarios come from the on-disk cache when possible
+                num_deliveries = len(st.session_state.delivery_data) - 1
+                if self.optimizer.seed is not None:
+                    delivery_data, results = _optimize_seeded_scenario(
+                        self.optimizer.seed, num_deliveries, num_vehicles, time_limit,
+                        include_time_windows, DATA_GENERATION.urban_percentage
+                    )
+                else:
+                    results = self.optimizer.optimize_single_scenario(
+                        num_deliveries=num_deliveries,
+                        num_vehicles=num_vehicles,
+                        time_limit_seconds=time_limit,
+                        include_time_windows=include_time_windows
+                    )
+                    delivery_data = self.optimizer.delivery_data
+
+                # Store results with the scenario they were computed on
+                st.session_state.delivery_data = _with_categorical_labels(delivery_data)
+                st.session_state.current_scenario = results['scenario_statistics']
                 st.session_state.optimization_results = results
 
                 st.success("✅ Optimization completed successfully!")
-                st.rerun()
 
             except Exception as e:
                 st.error(f"❌ Error during optimization: {str(e)}")
@@ -693,26 +824,21 @@ class Dashboard:
         """Load sample scenario for demonstration"""
         with st.spinner("📂 Loading sample scenario..."):
             try:
-                # Generate a sample scenario with fixed seed for consistency
+                # Generate and optimize a sample scenario with fixed seed for
+                # consistency, reusing a previous run if cached; later runs in
+                # this session stay on the seed
                 self.optimizer.seed = 42
-                delivery_data, scenario_summary = self.optimizer.generate_delivery_scenario(
-                    num_deliveries=25
-                )
-
-                # Run optimization on sample data
-                results = self.optimizer.optimize_single_scenario(
-                    num_deliveries=25,
-                    num_vehicles=4,
-                    time_limit_seconds=30
+                delivery_data, results = _optimize_seeded_scenario(
+                    42, 25, 4, 30, True, DATA_GENERATION.urban_percentage
                 )
+                scenario_summary = results['scenario_statistics']
 
                 # Store in session state
-                st.session_state.delivery_data = delivery_data
+                st.session_state.delivery_data = _with_categorical_labels(delivery_data)
                 st.session_state.current_scenario = scenario_summary
                 st.session_state.optimization_results = results
 
                 st.success("✅ Sample scenario loaded and optimized!")
-                st.rerun()
 
             except Exception as e:
                 st.error(f"❌ Error loading sample scenario: {str(e)}")
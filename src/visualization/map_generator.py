@@ -8,10 +8,73 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import json
+from functools import lru_cache
 import branca.colormap as cm
 from folium import plugins
 
 from ..utils.config import VISUALIZATION, GEOGRAPHIC
+from ..utils.geo import initial_bearing_deg
+
+# Above this many deliveries the heat map shows its points through one
+# FastMarkerCluster built from coordinate arrays instead of full markers
+FAST_CLUSTER_MIN_POINTS = 500
+
+# Popup skeletons for str.format: the format specs are parsed once per
+# process and each marker only fills in its values
+_DEPOT_POPUP_TEMPLATE = """
+            <div style="width: 200px;">
+                <h4 style="color: {color};">🏭 LPG Depot</h4>
+                <p><strong>Address:</strong> {address}</p>
+                <p><strong>Location:</strong> {lat:.4f}, {lon:.4f}</p>
+            </div>
+            """
+
+_DELIVERY_POPUP_TEMPLATE = """
+            <div style="width: 250px;">
+                <h4 style="color: {color};">
+                    {priority_emoji} Delivery Point #{location_id}
+                </h4>
+                <p><strong>{area_type_emoji} Area Type:</strong> {area_type}</p>
+                <p><strong>📦 Demand:</strong> {demand} LPG cylinders</p>
+                <p><strong>⏰ Time Window:</strong> {window_start} - {window_end}</p>
+                <p><strong>⏱️ Service Time:</strong> {service_minutes} minutes</p>
+                <p><strong>🚨 Priority:</strong> {priority}</p>
+                <p><strong>📍 Address:</strong> {address}</p>
+                <p><strong>🌍 Location:</strong> {lat:.4f}, {lon:.4f}</p>
+            </div>
+            """
+
+
+# Delivery ID labels are permanent tooltips drawn as bare white text
+_ID_BADGE_CSS = """
+<style>
+.leaflet-tooltip.id-badge {
+    background: transparent; border: none; box-shadow: none; padding: 0;
+    color: white; font-size: 8pt; font-weight: bold;
+}
+.leaflet-tooltip.id-badge::before { display: none; }
+</style>
+"""
+
+
+@lru_cache(maxsize=None)
+def _popup_labels(priority: str, area_type: str) -> Dict[str, str]:
+    """Emoji and display labels shared by every popup with this priority and area type"""
+    return {
+        'priority_emoji': {'emergency': '🚨', 'high': '⚡', 'normal': '📦'}.get(priority, '📦'),
+        'area_type_emoji': {'urban': '🏙️', 'rural': '🌾', 'depot': '🏭'}.get(area_type, '📍'),
+        'area_type': area_type.title(),
+        'priority': priority.title()
+    }
+
+
+@lru_cache(maxsize=256)
+def _route_number_html(route_color: str, route_number: int) -> str:
+    """Badge HTML for a route number label"""
+    return (f'<div style="background-color: {route_color}; color: white; '
+            f'border-radius: 50%; width: 25px; height: 25px; '
+            f'display: flex; align-items: center; justify-content: center; '
+            f'font-weight: bold; font-size: 12px;">{route_number}</div>')
 
 
 class MapGenerator:
@@ -29,9 +92,41 @@ class MapGenerator:
             'emergency_priority': 'darkred'
         }
 
+        self._priority_colors = {
+            'emergency': self.map_colors['emergency_priority'],
+            'high': self.map_colors['high_priority'],
+            'normal': self.map_colors['normal_priority']
+        }
+        self._coord_cache = (None, {})
+
+        # The legend only depends on the colors, so its HTML is built once
+        self._legend_html = """
+        <div style="position: fixed;
+                    bottom: 50px; left: 50px; width: 200px; height: 180px;
+                    background-color: white; border:2px solid grey; z-index:9999;
+                    font-size:14px; padding: 10px">
+        <h4 style="margin-top: 0; color: #333;">Route Legend</h4>
+        <p><i class="fa fa-circle" style="color:{depot_color}"></i> LPG Depot</p>
+        <p><i class="fa fa-circle" style="color:{before_color}"></i> Before Optimization</p>
+        <p><i class="fa fa-circle" style="color:{after_color}"></i> After Optimization</p>
+        <p><i class="fa fa-circle" style="color:orange"></i> Urban Delivery</p>
+        <p><i class="fa fa-circle" style="color:purple"></i> Rural Delivery</p>
+        <p><i class="fa fa-circle" style="color:red"></i> Emergency Priority</p>
+        <p><i class="fa fa-circle" style="color:blue"></i> Normal Priority</p>
+        </div>
+        """.format(
+            depot_color=self.map_colors['depot'],
+            before_color=self.map_colors['before_route'],
+            after_color=self.map_colors['after_route']
+        )
+
     def create_base_map(self, center_lat: float = None, center_lon: float = None,
-                       zoom_start: int = None) -> folium.Map:
-        """Create base map with appropriate center and zoom"""
+                       zoom_start: int = None, prefer_canvas: bool = True) -> folium.Map:
+        """
+        Create base map with appropriate center and zoom. prefer_canvas draws
+        vector layers (route lines, circle markers) on one canvas instead of
+        one SVG node each
+        """
         if center_lat is None:
             center_lat = GEOGRAPHIC.center_lat
         if center_lon is None:
@@ -43,7 +138,8 @@ class MapGenerator:
         m = folium.Map(
             location=[center_lat, center_lon],
             zoom_start=zoom_start,
-            tiles=VISUALIZATION.tile_layer
+            tiles=VISUALIZATION.tile_layer,
+            prefer_canvas=prefer_canvas
         )
 
         # Add alternative tile layers
@@ -53,16 +149,31 @@ class MapGenerator:
         return m
 
     def add_delivery_points(self, map_obj: folium.Map, delivery_data: pd.DataFrame,
-                          show_labels: bool = True) -> None:
-        """Add delivery points as markers to the map"""
-        for _, row in delivery_data.iterrows():
-            location_id = row['id']
-            lat = row['latitude']
-            lon = row['longitude']
-            demand = row['demand']
-            priority = row['priority']
-            area_type = row['area_type']
-            address = row['address']
+                          show_labels: bool = True, use_cluster: bool = True) -> None:
+        """
+        Add delivery points as markers to the map. With use_cluster, delivery
+        markers go into a MarkerCluster so the browser only draws the visible
+        clusters; the depot always stays a standalone marker
+        """
+        if show_labels:
+            map_obj.get_root().header.add_child(folium.Element(_ID_BADGE_CSS))
+
+        cluster = None
+        if use_cluster:
+            cluster = plugins.MarkerCluster(
+                name='Deliveries', chunked_loading=True, disable_clustering_at_zoom=14
+            ).add_to(map_obj)
+
+        priority_color = self._priority_colors.get
+        normal_color = self.map_colors['normal_priority']
+
+        # Plain column lists avoid building a Series per row
+        columns = ['id', 'latitude', 'longitude', 'demand', 'priority', 'area_type', 'address',
+                   'time_window_start', 'time_window_end', 'service_time_minutes']
+        for (location_id, lat, lon, demand, priority, area_type, address,
+             window_start, window_end, service_minutes) in zip(
+                *(delivery_data[column].tolist() for column in columns)):
+            layer = map_obj if cluster is None or location_id == 0 else cluster
 
             # Determine marker color and icon
             if location_id == 0:  # Depot
@@ -71,90 +182,83 @@ class MapGenerator:
                 prefix = 'fa'
             else:
                 # Color based on priority
-                if priority == 'emergency':
-                    color = self.map_colors['emergency_priority']
-                elif priority == 'high':
-                    color = self.map_colors['high_priority']
-                else:
-                    color = self.map_colors['normal_priority']
+                color = priority_color(priority, normal_color)
 
                 # Icon based on area type
                 icon = 'home' if area_type == 'urban' else 'building'
                 prefix = 'fa'
 
             # Create popup content
-            popup_content = self._create_delivery_popup(row)
+            popup_content = self._create_delivery_popup(
+                location_id, lat, lon, demand, priority, area_type, address,
+                window_start, window_end, service_minutes
+            )
 
             # Create tooltip
             tooltip = f"ID: {location_id}, Demand: {demand} cylinders" if location_id != 0 else "LPG Depot"
 
-            # Add marker
-            folium.Marker(
-                location=[lat, lon],
-                popup=folium.Popup(popup_content, max_width=300),
-                tooltip=tooltip,
-                icon=folium.Icon(color=color, icon=icon, prefix=prefix)
-            ).add_to(map_obj)
-
-            # Add text label if requested
+            # Labeled deliveries are one circle carrying its ID as a permanent
+            # tooltip; other points keep the icon marker
             if show_labels and location_id != 0:
                 folium.CircleMarker(
                     location=[lat, lon],
-                    radius=15,
+                    radius=10,
                     color='white',
+                    weight=1,
                     fill=True,
                     fillColor=color,
-                    fillOpacity=0.7,
-                    popup=folium.Popup(popup_content, max_width=300)
-                ).add_to(map_obj)
-
-                # Add label text
-                folium.map.Marker(
+                    fillOpacity=0.9,
+                    popup=folium.Popup(popup_content, max_width=300, lazy=True),
+                    tooltip=folium.Tooltip(str(location_id), sticky=False, permanent=True,
+                                           direction='center', class_name='id-badge')
+                ).add_to(layer)
+            else:
+                folium.Marker(
                     location=[lat, lon],
-                    icon=folium.DivIcon(
-                        html=f'<div style="font-size: 8pt; font-weight: bold; color: white; text-align: center;">{location_id}</div>',
-                        icon_size=(20, 20),
-                        icon_anchor=(10, 10)
-                    )
-                ).add_to(map_obj)
+                    popup=folium.Popup(popup_content, max_width=300, lazy=True),
+                    tooltip=tooltip,
+                    icon=folium.Icon(color=color, icon=icon, prefix=prefix)
+                ).add_to(layer)
 
-    def _create_delivery_popup(self, row) -> str:
+    def _create_delivery_popup(self, location_id, lat, lon, demand, priority, area_type,
+                               address, window_start, window_end, service_minutes) -> str:
         """Create HTML popup content for delivery point"""
-        if row['id'] == 0:  # Depot
-            return f"""
-            <div style="width: 200px;">
-                <h4 style="color: {self.map_colors['depot']};">🏭 LPG Depot</h4>
-                <p><strong>Address:</strong> {row['address']}</p>
-                <p><strong>Location:</strong> {row['latitude']:.4f}, {row['longitude']:.4f}</p>
-            </div>
-            """
-        else:
-            priority_emoji = {'emergency': '🚨', 'high': '⚡', 'normal': '📦'}.get(row['priority'], '📦')
-            area_type_emoji = {'urban': '🏙️', 'rural': '🌾', 'depot': '🏭'}.get(row['area_type'], '📍')
+        if location_id == 0:  # Depot
+            return _DEPOT_POPUP_TEMPLATE.format(
+                color=self.map_colors['depot'], address=address, lat=lat, lon=lon
+            )
+        return _DELIVERY_POPUP_TEMPLATE.format(
+            color=self.map_colors.get(priority, 'blue'), location_id=location_id,
+            demand=demand, window_start=window_start, window_end=window_end,
+            service_minutes=service_minutes, address=address, lat=lat, lon=lon,
+            **_popup_labels(priority, area_type)
+        )
 
-            return f"""
-            <div style="width: 250px;">
-                <h4 style="color: {self.map_colors.get(row['priority'], 'blue')};">
-                    {priority_emoji} Delivery Point #{row['id']}
-                </h4>
-                <p><strong>{area_type_emoji} Area Type:</strong> {row['area_type'].title()}</p>
-                <p><strong>📦 Demand:</strong> {row['demand']} LPG cylinders</p>
-                <p><strong>⏰ Time Window:</strong> {row['time_window_start']} - {row['time_window_end']}</p>
-                <p><strong>⏱️ Service Time:</strong> {row['service_time_minutes']} minutes</p>
-                <p><strong>🚨 Priority:</strong> {row['priority'].title()}</p>
-                <p><strong>📍 Address:</strong> {row['address']}</p>
-                <p><strong>🌍 Location:</strong> {row['latitude']:.4f}, {row['longitude']:.4f}</p>
-            </div>
-            """
+    def _coord_lookup(self, delivery_data: pd.DataFrame) -> Dict[int, Tuple[float, float]]:
+        """Location id -> (lat, lon), reused while the same DataFrame is passed"""
+        # One (source, lookup) attribute, so concurrent dashboard sessions
+        # sharing this generator never pair a lookup with the wrong frame
+        source, lookup = self._coord_cache
+        if source is delivery_data:
+            return lookup
+
+        lookup = dict(zip(delivery_data['id'].tolist(),
+                          zip(delivery_data['latitude'].tolist(),
+                              delivery_data['longitude'].tolist())))
+        self._coord_cache = (delivery_data, lookup)
+        return lookup
 
     def add_route_lines(self, map_obj: folium.Map, routes: List[Dict],
                        delivery_data: pd.DataFrame, route_color: str = 'blue',
                        line_weight: int = 3, line_opacity: float = 0.8,
-                       show_arrows: bool = True, show_route_numbers: bool = True) -> None:
-        """Add route lines to the map"""
-        # Create coordinate lookup
-        coord_lookup = {row['id']: (row['latitude'], row['longitude'])
-                       for _, row in delivery_data.iterrows()}
+                       show_arrows: bool = True, show_route_numbers: bool = True,
+                       layer_name: str = 'Routes') -> None:
+        """
+        Add route lines to the map. All routes of the set go into one GeoJson
+        layer, so Leaflet builds a single layer with one path per route
+        """
+        coord_lookup = self._coord_lookup(delivery_data)
+        features = []
 
         for route_idx, route in enumerate(routes):
             if len(route.get('stops', [])) < 2:
@@ -169,17 +273,18 @@ class MapGenerator:
             if len(route_coords) < 2:
                 continue
 
-            # Create route line
-            folium.PolyLine(
-                locations=route_coords,
-                color=route_color,
-                weight=line_weight,
-                opacity=line_opacity,
-                popup=f"Route {route_idx + 1}<br>"
-                      f"Distance: {route.get('total_distance', 0):.1f} km<br>"
-                      f"Deliveries: {len(route.get('stops', [])) - 2}<br>"
-                      f"Demand: {route.get('total_demand', 0)} cylinders"
-            ).add_to(map_obj)
+            # Route line as a GeoJSON feature (coordinates are lon, lat)
+            features.append({
+                'type': 'Feature',
+                'geometry': {'type': 'LineString',
+                             'coordinates': [[lon, lat] for lat, lon in route_coords]},
+                'properties': {
+                    'route': route_idx + 1,
+                    'distance_km': round(float(route.get('total_distance', 0)), 1),
+                    'deliveries': len(route['stops']) - 2,
+                    'demand': int(route.get('total_demand', 0))
+                }
+            })
 
             # Add directional arrows
             if show_arrows and len(route_coords) > 1:
@@ -193,42 +298,61 @@ class MapGenerator:
                 folium.Marker(
                     location=mid_point,
                     icon=folium.DivIcon(
-                        html=f'<div style="background-color: {route_color}; color: white; '
-                             f'border-radius: 50%; width: 25px; height: 25px; '
-                             f'display: flex; align-items: center; justify-content: center; '
-                             f'font-weight: bold; font-size: 12px;">{route_idx + 1}</div>',
+                        html=_route_number_html(route_color, route_idx + 1),
                         icon_size=(25, 25),
                         icon_anchor=(12, 12)
                     )
                 ).add_to(map_obj)
 
+        if features:
+            line_style = {'color': route_color, 'weight': line_weight, 'opacity': line_opacity}
+            folium.GeoJson(
+                {'type': 'FeatureCollection', 'features': features},
+                name=layer_name,
+                style_function=lambda feature: line_style,
+                popup=folium.GeoJsonPopup(
+                    fields=['route', 'distance_km', 'deliveries', 'demand'],
+                    aliases=['Route', 'Distance (km)', 'Deliveries', 'Demand (cylinders)']
+                )
+            ).add_to(map_obj)
+
     def _add_directional_arrows(self, map_obj: folium.Map, route_coords: List[Tuple[float, float]],
-                               color: str, arrow_interval: int = 3) -> None:
-        """Add directional arrows along route"""
-        for i in range(0, len(route_coords) - 1, arrow_interval):
-            if i + 1 < len(route_coords):
-                start = route_coords[i]
-                end = route_coords[i + 1]
-
-                # Calculate arrow position (midpoint)
-                mid_lat = (start[0] + end[0]) / 2
-                mid_lon = (start[1] + end[1]) / 2
-
-                # Calculate arrow direction
-                angle = np.degrees(np.arctan2(end[1] - start[1], end[0] - start[0]))
-
-                # Add arrow marker
-                folium.RegularPolygonMarker(
-                    location=[mid_lat, mid_lon],
-                    popup='Route Direction',
-                    number_of_sides=3,
-                    radius=8,
-                    rotation=angle,
-                    color=color,
-                    fill=True,
-                    fill_color=color,
-                    fill_opacity=0.8
-                ).add_to(map_obj)
+                               color: str, arrow_interval: int = 3, max_arrows: int = 6) -> None:
+        """
+        Add directional arrows along route: about one per arrow_interval
+        segments, capped at max_arrows and spaced evenly by path length
+        """
+        coords = np.asarray(route_coords, dtype=float)
+        steps = np.diff(coords, axis=0)
+        lengths = np.hypot(steps[:, 0], steps[:, 1])
+        cumulative = np.concatenate(([0.0], np.cumsum(lengths)))
+        if cumulative[-1] == 0:
+            return
+
+        num_arrows = min(max_arrows, -(-len(steps) // arrow_interval))
+        targets = np.linspace(0, cumulative[-1], num_arrows + 2)[1:-1]
+        segments = np.clip(np.searchsorted(cumulative, targets, side='right') - 1,
+                           0, len(steps) - 1)
+
+        # Calculate arrow positions along their segments and arrow directions
+        fractions = (targets - cumulative[segments]) / np.maximum(lengths[segments], 1e-12)
+        positions = coords[segments] + fractions[:, None] * steps[segments]
+        starts, ends = coords[segments], coords[segments + 1]
+        angles = initial_bearing_deg(starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1])
+
+        for (lat, lon), angle in zip(positions.tolist(), angles.tolist()):
+            # Add arrow marker
+            folium.RegularPolygonMarker(
+                location=[lat, lon],
+                popup='Route Direction',
+                number_of_sides=3,
+                radius=8,
+                rotation=angle,
+                color=color,
+                fill=True,
+                fill_color=color,
+                fill_opacity=0.8
+            ).add_to(map_obj)
 
     def create_before_after_map(self, delivery_data: pd.DataFrame,
                               baseline_routes: List[Dict],
@@ -247,8 +371,7 @@ class MapGenerator:
             Folium map object
         """
         # Calculate center point
-        center_lat = delivery_data['latitude'].mean()
-        center_lon = delivery_data['longitude'].mean()
+        center_lat, center_lon = delivery_data[['latitude', 'longitude']].mean().tolist()
 
         # Create base map
         m = self.create_base_map(center_lat, center_lon, zoom_start=10)
@@ -262,7 +385,8 @@ class MapGenerator:
                 m, baseline_routes, delivery_data,
                 route_color=self.map_colors['before_route'],
                 line_weight=3, line_opacity=0.6,
-                show_arrows=True, show_route_numbers=True
+                show_arrows=True, show_route_numbers=True,
+                layer_name='Baseline Routes'
             )
 
         # Add optimized routes (green)
@@ -271,7 +395,8 @@ class MapGenerator:
                 m, optimized_routes, delivery_data,
                 route_color=self.map_colors['after_route'],
                 line_weight=4, line_opacity=0.8,
-                show_arrows=True, show_route_numbers=True
+                show_arrows=True, show_route_numbers=True,
+                layer_name='Optimized Routes'
             )
 
         # Add legend
@@ -300,27 +425,7 @@ class MapGenerator:
 
     def _add_legend(self, map_obj: folium.Map) -> None:
         """Add legend to the map"""
-        legend_html = """
-        <div style="position: fixed;
-                    bottom: 50px; left: 50px; width: 200px; height: 180px;
-                    background-color: white; border:2px solid grey; z-index:9999;
-                    font-size:14px; padding: 10px">
-        <h4 style="margin-top: 0; color: #333;">Route Legend</h4>
-        <p><i class="fa fa-circle" style="color:{depot_color}"></i> LPG Depot</p>
-        <p><i class="fa fa-circle" style="color:{before_color}"></i> Before Optimization</p>
-        <p><i class="fa fa-circle" style="color:{after_color}"></i> After Optimization</p>
-        <p><i class="fa fa-circle" style="color:orange"></i> Urban Delivery</p>
-        <p><i class="fa fa-circle" style="color:purple"></i> Rural Delivery</p>
-        <p><i class="fa fa-circle" style="color:red"></i> Emergency Priority</p>
-        <p><i class="fa fa-circle" style="color:blue"></i> Normal Priority</p>
-        </div>
-        """.format(
-            depot_color=self.map_colors['depot'],
-            before_color=self.map_colors['before_route'],
-            after_color=self.map_colors['after_route']
-        )
-
-        map_obj.get_root().html.add_child(folium.Element(legend_html))
+        map_obj.get_root().html.add_child(folium.Element(self._legend_html))
 
     def create_route_analysis_map(self, delivery_data: pd.DataFrame,
                                 routes: List[Dict], route_type: str = 'optimized',
@@ -338,8 +443,7 @@ class MapGenerator:
             Folium map object
         """
         # Calculate center point
-        center_lat = delivery_data['latitude'].mean()
-        center_lon = delivery_data['longitude'].mean()
+        center_lat, center_lon = delivery_data[['latitude', 'longitude']].mean().tolist()
 
         # Create base map
         m = self.create_base_map(center_lat, center_lon, zoom_start=11)
@@ -356,7 +460,8 @@ class MapGenerator:
             m, routes, delivery_data,
             route_color=route_color,
             line_weight=4, line_opacity=0.8,
-            show_arrows=True, show_route_numbers=True
+            show_arrows=True, show_route_numbers=True,
+            layer_name=f'{route_type.title()} Routes'
         )
 
         # Add detailed analysis if requested
@@ -375,9 +480,11 @@ class MapGenerator:
                                 delivery_data: pd.DataFrame, route_type: str) -> None:
         """Add route analysis panel to map"""
         # Calculate route statistics
-        total_distance = sum(route.get('total_distance', 0) for route in routes)
-        total_deliveries = sum(len(route.get('stops', [])) - 2 for route in routes)
-        total_demand = sum(route.get('total_demand', 0) for route in routes)
+        total_distance = total_deliveries = total_demand = 0
+        for route in routes:
+            total_distance += route.get('total_distance', 0)
+            total_deliveries += len(route.get('stops', [])) - 2
+            total_demand += route.get('total_demand', 0)
 
         analysis_html = f"""
         <div style="position: fixed;
@@ -408,18 +515,20 @@ class MapGenerator:
             Folium map with heat map overlay
         """
         # Calculate center point
-        center_lat = delivery_data['latitude'].mean()
-        center_lon = delivery_data['longitude'].mean()
+        center_lat, center_lon = delivery_data[['latitude', 'longitude']].mean().tolist()
 
         # Create base map
         m = self.create_base_map(center_lat, center_lon, zoom_start=10)
 
         # Prepare heat map data
-        heat_data = []
-        for _, row in delivery_data.iterrows():
-            if row['id'] != 0:  # Exclude depot
-                weight = row[metric_column] if metric_column in row else 1
-                heat_data.append([row['latitude'], row['longitude'], weight])
+        deliveries = delivery_data['id'].to_numpy() != 0  # Exclude depot
+        weights = (delivery_data[metric_column].to_numpy(dtype=float)[deliveries]
+                   if metric_column in delivery_data else np.ones(deliveries.sum()))
+        heat_data = np.column_stack([
+            delivery_data['latitude'].to_numpy(dtype=float)[deliveries],
+            delivery_data['longitude'].to_numpy(dtype=float)[deliveries],
+            weights
+        ]).tolist()
 
         # Add heat map
         plugins.HeatMap(
@@ -430,8 +539,15 @@ class MapGenerator:
             gradient={0.4: 'blue', 0.6: 'cyan', 0.7: 'lime', 0.8: 'yellow', 1.0: 'red'}
         ).add_to(m)
 
-        # Add delivery points as markers
-        self.add_delivery_points(m, delivery_data, show_labels=False)
+        # Add delivery points as markers; large sets skip per-marker popups
+        if len(heat_data) > FAST_CLUSTER_MIN_POINTS:
+            self.add_delivery_points(m, delivery_data[~deliveries], show_labels=False,
+                                     use_cluster=False)
+            plugins.FastMarkerCluster(
+                [point[:2] for point in heat_data], name='Deliveries'
+            ).add_to(m)
+        else:
+            self.add_delivery_points(m, delivery_data, show_labels=False)
 
         # Add layer control
         folium.LayerControl().add_to(m)
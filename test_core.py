@@ -12,6 +12,8 @@ import pandas as pd
 from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
 
+from utils.metrics import MetricsCalculator
+
 
 def test_basic_vrp():
     """Test basic Vehicle Routing Problem functionality"""
@@ -141,41 +143,28 @@ def test_mock_data_generation():
     # Create mock delivery points
     print("📍 Generating mock delivery scenario...")
 
-    # Sample delivery data
-    deliveries = []
-    for i in range(1, 11):  # 10 delivery points
-        lat = 32.7 + np.random.uniform(-0.1, 0.1)  # Around Dallas area
-        lon = -96.8 + np.random.uniform(-0.1, 0.1)
-        demand = np.random.randint(1, 20)
-
-        deliveries.append({
-            'id': i,
-            'latitude': lat,
-            'longitude': lon,
-            'demand': demand,
-            'priority': np.random.choice(['normal', 'high', 'emergency'], p=[0.8, 0.15, 0.05]),
-            'area_type': np.random.choice(['urban', 'rural'], p=[0.6, 0.4]),
-            'time_window_start': f"{8 + i//2:02d}:00",
-            'time_window_end': f"{10 + i//2:02d}:00",
-            'service_time_minutes': 15 + demand * 2
-        })
-
-    df = pd.DataFrame(deliveries)
-
-    # Add depot
-    depot_row = {
-        'id': 0,
-        'latitude': 32.7767,
-        'longitude': -96.7970,
-        'demand': 0,
-        'priority': 'depot',
-        'area_type': 'depot',
-        'time_window_start': '08:00',
-        'time_window_end': '18:00',
-        'service_time_minutes': 0
-    }
-
-    df = pd.concat([pd.DataFrame([depot_row]), df], ignore_index=True)
+    # Sample delivery data, one batched draw per column
+    rng = np.random.default_rng(0)
+    n = 10  # 10 delivery points
+    ids = np.arange(1, n + 1)
+    demands = rng.integers(1, 20, n)
+
+    # Depot occupies row 0 of every column, so the frame is built once
+    def with_depot(depot_value, values):
+        return np.concatenate([[depot_value], values])
+
+    df = pd.DataFrame({
+        'id': with_depot(0, ids),
+        'latitude': with_depot(32.7767, 32.7 + rng.uniform(-0.1, 0.1, n)),  # Around Dallas area
+        'longitude': with_depot(-96.7970, -96.8 + rng.uniform(-0.1, 0.1, n)),
+        'demand': with_depot(0, demands),
+        'priority': with_depot('depot', rng.choice(['normal', 'high', 'emergency'],
+                                                   p=[0.8, 0.15, 0.05], size=n)),
+        'area_type': with_depot('depot', rng.choice(['urban', 'rural'], p=[0.6, 0.4], size=n)),
+        'time_window_start': ['08:00'] + [f"{8 + i//2:02d}:00" for i in ids],
+        'time_window_end': ['18:00'] + [f"{10 + i//2:02d}:00" for i in ids],
+        'service_time_minutes': with_depot(0, 15 + demands * 2)
+    })
 
     print(f"✅ Generated {len(df)-1} delivery points + 1 depot")
     print(f"  - Urban: {(df['area_type'] == 'urban').sum()}")
@@ -201,31 +190,19 @@ def test_distance_matrix():
 
     print(f"📍 Calculating distances for {len(coords)} locations...")
 
-    # Calculate distance matrix
-    def haversine_distance(lat1, lon1, lat2, lon2):
-        """Calculate haversine distance between two points"""
-        R = 6371  # Earth's radius in kilometers
-
-        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        c = 2 * np.arcsin(np.sqrt(a))
-
-        return R * c
+    # Calculate haversine distances for all pairs in one broadcast
+    R = 6371  # Earth's radius in kilometers
+    radians = np.radians(np.asarray(coords))
+    lat, lon = radians[:, 0], radians[:, 1]
 
-    # Create distance matrix
-    distance_matrix = np.zeros((len(coords), len(coords)))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat/2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon/2)**2
+    distance_matrix = 2 * R * np.arcsin(np.sqrt(a))
 
-    for i in range(len(coords)):
-        for j in range(len(coords)):
-            if i != j:
-                distance = haversine_distance(coords[i][0], coords[i][1],
-                                             coords[j][0], coords[j][1])
-                # Add realistic detour factor
-                distance *= np.random.uniform(1.2, 1.5)
-                distance_matrix[i][j] = distance
+    # Add realistic detour factor
+    distance_matrix *= np.random.uniform(1.2, 1.5, size=distance_matrix.shape)
+    np.fill_diagonal(distance_matrix, 0)
 
     print("✅ Distance matrix calculated:")
     print("    Depot    P1      P2      P3")
@@ -236,6 +213,107 @@ def test_distance_matrix():
     return distance_matrix
 
 
+def _sample_solutions():
+    """Two small solutions over the same five deliveries, plus their delivery data"""
+    baseline = {'routes': [
+        {'stops': [0, 1, 2, 0], 'total_distance': 52.4, 'total_demand': 25},
+        {'stops': [0, 3, 0], 'total_distance': 31.0, 'total_demand': 10},
+        {'stops': [0, 4, 5, 0], 'total_distance': 40.1, 'total_demand': 25},
+    ]}
+    optimized = {'routes': [
+        {'stops': [0, 1, 2, 3, 0], 'total_distance': 45.2, 'total_demand': 35},
+        {'stops': [0, 4, 5, 0], 'total_distance': 28.7, 'total_demand': 25},
+    ]}
+    delivery_data = pd.DataFrame({
+        'id': [0, 1, 2, 3, 4, 5],
+        'demand': [0, 10, 15, 10, 12, 13],
+        'time_window_start': ['08:00', '08:00', '09:00', '10:00', '11:00', '12:00'],
+        'time_window_end': ['18:00', '10:00', '11:00', '12:00', '13:00', '14:00'],
+        'service_time_minutes': [0, 20, 25, 20, 22, 23]
+    })
+    return baseline, optimized, delivery_data
+
+
+def test_kpi_summary_batch():
+    """Test that batched KPIs match per-scenario KPI summaries"""
+    print("\n🧪 Testing Batched KPI Summary")
+    print("=" * 50)
+
+    baseline, optimized, delivery_data = _sample_solutions()
+    solutions = [baseline, optimized, {'routes': []}]
+    calculator = MetricsCalculator()
+
+    batch = calculator.generate_kpi_summary_batch(solutions, delivery_data)
+    for k, solution in enumerate(solutions):
+        kpis = calculator.generate_kpi_summary(solution, delivery_data)
+        expected = {**kpis['cost_metrics'], **kpis['operational_metrics'],
+                    'capacity_utilization_percent': kpis['efficiency_metrics']['capacity_utilization_percent'],
+                    'fuel_consumption_gallons': kpis['environmental_metrics']['fuel_consumption_gallons'],
+                    'co2_emissions_lb': kpis['environmental_metrics']['co2_emissions_lb']}
+        for key in batch:
+            assert np.isclose(batch[key][k], expected[key]), (k, key, batch[key][k], expected[key])
+
+    print(f"✅ {len(batch)} KPIs match for {len(solutions)} solutions")
+
+
+def test_pinned_baseline():
+    """Test that a pinned baseline gives the same improvements and clearing it restores recomputation"""
+    print("\n🧪 Testing Pinned Baseline Comparison")
+    print("=" * 50)
+
+    baseline, optimized, _ = _sample_solutions()
+    expected = MetricsCalculator().compare_solutions(baseline, optimized)
+    calculator = MetricsCalculator()
+
+    calculator.set_baseline(baseline)
+    pinned = calculator.compare_solutions(baseline, optimized)
+    for key in ('distance_improvement_km', 'distance_improvement_percent', 'cost_improvement',
+                'cost_improvement_percent', 'time_improvement_hours', 'fuel_improvement_gallons',
+                'vehicles_reduction'):
+        assert np.isclose(pinned[key], expected[key]), (key, pinned[key], expected[key])
+    assert np.isclose(pinned['distance_improvement_km'], 52.4 + 31.0 + 40.1 - 45.2 - 28.7)
+    assert pinned['vehicles_reduction'] == 1
+    print(f"✅ Pinned baseline: {pinned['cost_improvement_percent']:.1f}% cost improvement")
+
+    # Once cleared, the baseline is recomputed from its routes on every call
+    calculator.clear_baseline()
+    baseline['routes'][0]['total_distance'] = 60.0
+    recomputed = calculator.compare_solutions(baseline, optimized)
+    fresh = MetricsCalculator().compare_solutions(baseline, optimized)
+    assert np.isclose(recomputed['distance_improvement_km'], 60.0 + 31.0 + 40.1 - 45.2 - 28.7)
+    assert np.isclose(recomputed['cost_improvement'], fresh['cost_improvement'])
+    print(f"✅ Cleared baseline: {recomputed['cost_improvement_percent']:.1f}% cost improvement")
+
+
+def test_time_window_arrays():
+    """Test that precomputed delivery arrays give the same time-window metrics as the DataFrame"""
+    print("\n🧪 Testing Time Window Performance Inputs")
+    print("=" * 50)
+
+    _, optimized, delivery_data = _sample_solutions()
+    # Long legs from the depot so some stops arrive after their window closes
+    time_matrix = np.full((6, 6), 30.0)
+    time_matrix[0, 1:] = time_matrix[1:, 0] = 150.0
+    np.fill_diagonal(time_matrix, 0)
+
+    delivery_arrays = {
+        'id': delivery_data['id'].to_numpy(),
+        'tw_start_min': np.array([8 * 60, 8 * 60, 9 * 60, 10 * 60, 11 * 60, 12 * 60]),
+        'tw_end_min': np.array([18 * 60, 10 * 60, 11 * 60, 12 * 60, 13 * 60, 14 * 60]),
+        'service_min': delivery_data['service_time_minutes'].to_numpy()
+    }
+
+    calculator = MetricsCalculator()
+    from_frame = calculator.calculate_time_window_performance(optimized, delivery_data, time_matrix)
+    from_arrays = calculator.calculate_time_window_performance(optimized, None, time_matrix,
+                                                               delivery_arrays=delivery_arrays)
+
+    assert from_frame['time_window_violations'] > 0
+    assert from_arrays == from_frame, (from_arrays, from_frame)
+    print(f"✅ Both inputs give {from_frame['time_window_violations']} violations, "
+          f"{from_frame['total_wait_time_minutes']:.0f} min waiting")
+
+
 def main():
     """Main test function"""
     print("🎯 LPG Delivery Route Optimization - Core Functionality Test")
@@ -251,6 +329,15 @@ def main():
         # Test 3: Distance Matrix
         distance_matrix = test_distance_matrix()
 
+        # Test 4: Batched KPI summary
+        test_kpi_summary_batch()
+
+        # Test 5: Pinned baseline comparison
+        test_pinned_baseline()
+
+        # Test 6: Time window performance inputs
+        test_time_window_arrays()
+
         print("\n" + "=" * 70)
         print("🎉 CORE FUNCTIONALITY TEST RESULTS")
         print("=" * 70)